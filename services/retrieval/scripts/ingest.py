@@ -283,6 +283,10 @@ class ETLPipeline:
         if self.state:
             self.checkpoint_manager.save_checkpoint(self.state)
 
+    def close(self):
+        """Release the API client's worker processes and HTTP cache."""
+        self.api_client.close()
+
 
 
 def main():
@@ -403,16 +407,19 @@ Examples:
 
     # Run pipeline
     pipeline = ETLPipeline()
-    pipeline.run(
-        crawl_laws=crawl_laws,
-        crawl_cases=crawl_cases,
-        crawl_eurlex=args.eurlex,
-        max_laws=args.max_laws,
-        max_cases=args.max_cases,
-        max_eurlex=args.max_eurlex,
-        force_recreate_collection=args.force_recreate,
-        resume_from=args.resume,
-    )
+    try:
+        pipeline.run(
+            crawl_laws=crawl_laws,
+            crawl_cases=crawl_cases,
+            crawl_eurlex=args.eurlex,
+            max_laws=args.max_laws,
+            max_cases=args.max_cases,
+            max_eurlex=args.max_eurlex,
+            force_recreate_collection=args.force_recreate,
+            resume_from=args.resume,
+        )
+    finally:
+        pipeline.close()
 
 
 if __name__ == "__main__":
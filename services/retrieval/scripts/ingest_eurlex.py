@@ -275,7 +275,7 @@ class EURLexPipeline:
                             # Process batch when full
                             if len(chunk_batch) >= EMBEDDING_BATCH_SIZE:
                                 # Generate embeddings for this batch on GPU via Modal (31x speedup)
-                                embed_func = modal.Function.from_name("juragpt-embedder", "embed_batch_gpu")
+                                embed_func = modal.Cls.from_name("juragpt-embedder", "Embedder")().embed
                                 texts = [chunk["text"] for chunk in chunk_batch]
                                 batch_embeddings = embed_func.remote(texts)
 
@@ -304,7 +304,7 @@ class EURLexPipeline:
                     # Process remaining chunks
                     if chunk_batch:
                         # Generate embeddings for final batch on GPU via Modal (31x speedup)
-                        embed_func = modal.Function.from_name("juragpt-embedder", "embed_batch_gpu")
+                        embed_func = modal.Cls.from_name("juragpt-embedder", "Embedder")().embed
                         texts = [chunk["text"] for chunk in chunk_batch]
                         batch_embeddings = embed_func.remote(texts)
 
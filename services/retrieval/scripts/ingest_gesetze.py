@@ -368,7 +368,7 @@ class GesetzeIngestionPipeline:
                 logger.info(f"Processing {len(remaining_chunks)} chunks in batches of {batch_size}")
 
                 # Lookup Modal GPU function once before loop
-                embed_func = modal.Function.from_name("juragpt-embedder", "embed_batch_gpu")
+                embed_func = modal.Cls.from_name("juragpt-embedder", "Embedder")().embed
 
                 for batch_idx in range(num_batches):
                     start_idx = batch_idx * batch_size
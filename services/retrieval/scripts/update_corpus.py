@@ -181,7 +181,7 @@ class IncrementalUpdateService:
 
         # Step 5: Generate embeddings on GPU via Modal (31x faster than CPU)
         logger.info("\n=== Step 4: Generate Embeddings (Modal GPU) ===")
-        embed_func = modal.Function.from_name("juragpt-embedder", "embed_batch_gpu")
+        embed_func = modal.Cls.from_name("juragpt-embedder", "Embedder")().embed
         texts = [chunk["text"] for chunk in chunks]
         embeddings = embed_func.remote(texts)
         logger.info(f"Generated {len(embeddings)} embeddings using GPU")
@@ -232,6 +232,10 @@ class IncrementalUpdateService:
             "total_vectors": collection_info['points_count']
         }
 
+    def close(self):
+        """Release the API client's worker processes and HTTP cache."""
+        self.api_client.close()
+
     def show_stats(self):
         """Display update statistics."""
         stats = self.update_tracker.get_stats()
@@ -311,10 +315,14 @@ Examples:
     # Show stats and exit
     if args.stats:
         service = IncrementalUpdateService()
-        service.show_stats()
+        try:
+            service.show_stats()
+        finally:
+            service.close()
         return
 
     # Run update
+    service = None
     try:
         service = IncrementalUpdateService()
         result = service.run_update(
@@ -335,6 +343,9 @@ Examples:
     except Exception as e:
         logger.error(f"Update failed: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        if service:
+            service.close()
 
 
 if __name__ == "__main__":
@@ -4,29 +4,199 @@ ABOUTME: Comprehensive verification script for ingestion pipeline completion.
 ABOUTME: Checks Qdrant collection health, vector counts, retrieval quality, duplicates, coverage.
 
 Usage:
-    python scripts/verify_ingestion.py [--verbose] [--save-report]
+    python scripts/verify_ingestion.py [--verbose] [--save-report] [--no-cache]
+    python -m scripts.verify_ingestion [...]   # from services/retrieval
+
+Query embeddings and collection scan aggregates are cached in
+~/.cache/juragpt/verify/ between runs. Scan aggregates are only reused while the
+collection point count and status are unchanged since the last successful run.
 """
 
+import os
 import sys
 import json
+import hashlib
 import argparse
+import importlib.util
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Callable, Optional
 from collections import defaultdict
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
+import orjson
+from qdrant_client.models import Filter, FieldCondition, MatchAny, MatchValue
+
+# Add src to path unless it is already importable (e.g. run with python -m)
+if importlib.util.find_spec("src") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.storage.qdrant_client import JuraGPTQdrantClient
 from src.embedding.embedder import LegalTextEmbedder
 
+CACHE_DIR = Path.home() / ".cache" / "juragpt" / "verify"
+
+# Payload "type" values written by the EUR-Lex and gesetze ingestion pipelines
+EURLEX_TYPES = frozenset({"eurlex", "eu_law", "eu_regulation", "eu_directive", "eu_decision"})
+GESETZE_TYPE = "law"
+GESETZE_DOC_PREFIX = "gesetze_github_"
+
+
+def source_for_type(doc_type: Any) -> str:
+    """
+    Source of a point from its payload "type".
+
+    The only source rule, so facet counts and the scroll scan (and the
+    cross-source check) always classify a point the same way.
+    """
+    if doc_type in EURLEX_TYPES:
+        return "eurlex"
+    if doc_type == GESETZE_TYPE:
+        return "gesetze_github"
+    return "unknown"
+
+
+# Keyword payload indexes that check_1 ensures exist
+INDEXED_FIELDS = ("type", "law", "doc_id")
+
+# Search filters are immutable, so build them once instead of per query
+EURLEX_FILTER = Filter(must=[FieldCondition(key="type", match=MatchAny(any=sorted(EURLEX_TYPES)))])
+LAW_FILTERS = {
+    code: Filter(must=[FieldCondition(key="law", match=MatchValue(value=code))])
+    for code in ("BGB", "StGB", "GG", "HGB")
+}
+
+
+class VerificationCache:
+    """
+    On-disk cache for query embeddings and collection scan aggregates.
+
+    Embeddings are keyed by embedding model name. Scan aggregates are keyed by
+    collection name, point count and status, and are only persisted after a
+    fully successful verification run.
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, refresh: bool = False):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory for cache files
+            refresh: Ignore existing cache entries (entries are still rewritten)
+        """
+        self.cache_dir = cache_dir
+        self.refresh = refresh
+        self.embeddings_path = cache_dir / "embeddings.npz"
+        self.aggregates_path = cache_dir / "aggregates.json"
+
+        self._embeddings_key: Optional[str] = None
+        self._embeddings: Dict[str, np.ndarray] = {}
+        self._embeddings_dirty = False
+
+        self._aggregates_key: Optional[str] = None
+        self._aggregates: Dict[str, Any] = {}
+
+    @staticmethod
+    def _hash(*parts: Any) -> str:
+        """Build a stable cache key from the given parts."""
+        return hashlib.sha256("\x00".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def collection_key(cls, info: Dict[str, Any]) -> str:
+        """Cache key for scan aggregates of a collection snapshot."""
+        status = getattr(info["status"], "value", info["status"])
+        return cls._hash(info["name"], info["points_count"], status)
+
+    def load_embeddings(self, model_name: str):
+        """Load cached query embeddings for the given model."""
+        self._embeddings_key = self._hash(model_name)
+        self._embeddings = {}
+
+        if self.refresh or not self.embeddings_path.exists():
+            return
+
+        try:
+            with np.load(self.embeddings_path, allow_pickle=False) as data:
+                if str(data["key"]) != self._embeddings_key:
+                    return
+                self._embeddings = dict(zip(data["queries"].tolist(), data["vectors"]))
+        except Exception as e:
+            print(f"⚠️  Ignoring unreadable embedding cache: {e}")
+
+    def get_embedding(self, query: str) -> Optional[List[float]]:
+        """Return cached embedding for query, if present."""
+        vector = self._embeddings.get(query)
+        return vector.tolist() if vector is not None else None
+
+    def put_embedding(self, query: str, vector: List[float]):
+        """Store a query embedding."""
+        self._embeddings[query] = np.asarray(vector, dtype=np.float32)
+        self._embeddings_dirty = True
+
+    def save_embeddings(self):
+        """Persist query embeddings if any were added."""
+        if not self._embeddings_dirty or not self._embeddings:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        queries = list(self._embeddings)
+        with open(self.embeddings_path, "wb") as f:
+            np.savez(
+                f,
+                key=np.array(self._embeddings_key),
+                queries=np.array(queries),
+                vectors=np.stack([self._embeddings[q] for q in queries]),
+            )
+        self._embeddings_dirty = False
+
+    def get_aggregate(self, name: str, info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return cached scan aggregate if the collection is unchanged."""
+        if self.refresh:
+            return None
+
+        key = self.collection_key(info)
+        if self._aggregates_key is None and self.aggregates_path.exists():
+            try:
+                with open(self.aggregates_path, "r", encoding="utf-8") as f:
+                    stored = json.load(f)
+                self._aggregates_key = stored.get("key")
+                self._aggregates = stored.get("aggregates", {})
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️  Ignoring unreadable aggregate cache: {e}")
+
+        if self._aggregates_key != key:
+            return None
+        return self._aggregates.get(name)
+
+    def put_aggregate(self, name: str, info: Dict[str, Any], value: Dict[str, Any]):
+        """Store a scan aggregate (persisted by save_aggregates)."""
+        key = self.collection_key(info)
+        if self._aggregates_key != key:
+            self._aggregates_key = key
+            self._aggregates = {}
+        self._aggregates[name] = value
+
+    def save_aggregates(self):
+        """Persist scan aggregates."""
+        if self._aggregates_key is None or not self._aggregates:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.aggregates_path, "w", encoding="utf-8") as f:
+            json.dump({"key": self._aggregates_key, "aggregates": self._aggregates}, f)
+
 
 class IngestionVerifier:
     """Verify ingestion pipeline completion and quality."""
 
-    def __init__(self, verbose: bool = False):
-        """Initialize verifier."""
+    def __init__(self, verbose: bool = False, use_cache: bool = True):
+        """
+        Initialize verifier.
+
+        Args:
+            verbose: Enable verbose logging
+            use_cache: Reuse cached embeddings and scan aggregates from previous runs
+        """
         self.verbose = verbose
         self.results = {
             "timestamp": datetime.now().isoformat(),
@@ -39,23 +209,71 @@ class IngestionVerifier:
             }
         }
 
-        # Initialize clients
+        # Initialize clients (embedder is loaded lazily on first cache miss)
         print("Initializing components...")
         self.qdrant_client = JuraGPTQdrantClient()
-        self.embedder = LegalTextEmbedder()
+        self._embedder: Optional[LegalTextEmbedder] = None
+        self.model_name = os.getenv("EMBEDDING_MODEL", LegalTextEmbedder.DEFAULT_MODEL)
+        self.cache = VerificationCache(refresh=not use_cache)
+        self.cache.load_embeddings(self.model_name)
         print("✓ Components initialized\n")
 
-    def _log(self, message: str):
-        """Log message if verbose."""
+    @property
+    def embedder(self) -> LegalTextEmbedder:
+        """Load the embedding model on first use."""
+        if self._embedder is None:
+            print("Loading embedding model...")
+            self._embedder = LegalTextEmbedder(model_name=self.model_name)
+        return self._embedder
+
+    def _encode_query(self, query: str) -> List[float]:
+        """Encode query, reusing cached embeddings from previous runs."""
+        vector = self.cache.get_embedding(query)
+        if vector is None:
+            vector = self.embedder.encode_query(query)
+            self.cache.put_embedding(query, vector)
+        return vector
+
+    def _encode_queries(self, queries: List[str]) -> List[List[float]]:
+        """Encode queries, reusing cached embeddings and encoding all misses in one batch."""
+        vectors = [self.cache.get_embedding(query) for query in queries]
+        misses = [i for i, vector in enumerate(vectors) if vector is None]
+
+        if misses:
+            encoded = self.embedder.encode_queries([queries[i] for i in misses])
+            for i, vector in zip(misses, encoded):
+                vectors[i] = vector
+                self.cache.put_embedding(queries[i], vector)
+
+        return vectors
+
+    def _cached_scan(
+        self, name: str, info: Dict[str, Any], scan: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Return a cached scroll aggregate, or run the scan and cache its result."""
+        aggregate = self.cache.get_aggregate(name, info)
+        if aggregate is not None:
+            self._log("Using cached scan results for %s (collection unchanged)", name)
+            return aggregate
+
+        aggregate = scan()
+        self.cache.put_aggregate(name, info, aggregate)
+        return aggregate
+
+    def _log(self, message: str, *args: Any):
+        """Log message if verbose (args are %-interpolated only when logging)."""
         if self.verbose:
-            print(f"  {message}")
+            print(f"  {message % args if args else message}")
 
     def _pass_check(self, check_name: str, details: Dict[str, Any]):
-        """Record a passed check."""
+        """Record a passed check (keeping warnings recorded before it)."""
+        warnings = self.results["checks"].get(check_name, {}).get("warnings")
         self.results["checks"][check_name] = {
             "status": "PASS",
             "details": details
         }
+        if warnings:
+            self.results["checks"][check_name]["warnings"] = warnings
         self.results["summary"]["passed"] += 1
 
     def _fail_check(self, check_name: str, reason: str, details: Dict[str, Any] = None):
@@ -81,6 +299,47 @@ class IngestionVerifier:
         self.results["checks"][check_name]["warnings"].append(reason)
         self.results["summary"]["warnings"] += 1
 
+    def _facet_breakdown(
+        self, total_vectors: int, expected_eurlex: int, expected_gesetze: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Count vectors per source from facets on the "type" payload index.
+
+        Returns:
+            Breakdown in the same shape as the scroll scan, or None if the facet
+            call fails or the split deviates more than 5% from expectations
+        """
+        try:
+            response = self.qdrant_client.client.facet(
+                collection_name=self.qdrant_client.collection_name,
+                key="type",
+                limit=100,
+                exact=True,
+            )
+        except Exception as e:
+            self._log("Facet counts unavailable, falling back to full scan: %s", e)
+            return None
+
+        type_counts = {str(hit.value): hit.count for hit in response.hits}
+        classified = defaultdict(int)
+        for doc_type, count in type_counts.items():
+            classified[source_for_type(doc_type)] += count
+        eurlex = classified["eurlex"]
+        gesetze = classified["gesetze_github"]
+
+        for count, expected in ((eurlex, expected_eurlex), (gesetze, expected_gesetze)):
+            if abs(count - expected) > expected * 0.05:
+                self._log("Facet counts deviate from expected split, falling back to full scan")
+                return None
+
+        source_counts = {"eurlex": eurlex, "gesetze_github": gesetze}
+        unknown = total_vectors - eurlex - gesetze
+        if unknown > 0:
+            source_counts["unknown"] = unknown
+
+        self._log("Source split settled from facet counts (no scan needed)")
+        return {"source_counts": source_counts, "type_counts": type_counts}
+
     def check_1_collection_stats(self) -> bool:
         """Check 1: Qdrant collection stats."""
         print("=" * 80)
@@ -90,10 +349,10 @@ class IngestionVerifier:
         try:
             info = self.qdrant_client.get_collection_info()
 
-            self._log(f"Collection: {info['name']}")
+            self._log("Collection: %s", info['name'])
             self._log(f"Points: {info['points_count']:,}")
             self._log(f"Vectors: {info['vectors_count']:,}")
-            self._log(f"Status: {info['status']}")
+            self._log("Status: %s", info['status'])
 
             # Check if collection exists and has data
             if info['points_count'] == 0:
@@ -104,6 +363,19 @@ class IngestionVerifier:
             if info['status'] != 'green':
                 self._warn_check("collection_stats", f"Collection status is {info['status']}", info)
 
+            # Facet/count fast paths in later checks rely on these payload indexes
+            try:
+                created = self.qdrant_client.ensure_payload_indexes(INDEXED_FIELDS)
+                info["payload_indexes_created"] = created
+                if created:
+                    self._warn_check(
+                        "collection_stats",
+                        f"Created missing payload indexes: {', '.join(created)}",
+                        info
+                    )
+            except Exception as e:
+                self._warn_check("collection_stats", f"Could not verify payload indexes: {e}", info)
+
             self._pass_check("collection_stats", info)
             print(f"✅ PASS: Collection has {info['points_count']:,} vectors, status: {info['status']}\n")
             return True
@@ -124,61 +396,64 @@ class IngestionVerifier:
             info = self.qdrant_client.get_collection_info()
             total_vectors = info['points_count']
 
-            # Scroll through all points to count by source
-            # Use small batch size to avoid memory issues
-            offset = None
-            source_counts = defaultdict(int)
-            type_counts = defaultdict(int)
-
-            self._log("Scanning all vectors to count by source...")
-            scanned = 0
-
-            while True:
-                # Scroll batch
-                result, offset = self.qdrant_client.client.scroll(
-                    collection_name=self.qdrant_client.collection_name,
-                    limit=1000,
-                    offset=offset,
-                    with_payload=True,
-                    with_vectors=False,
-                )
-
-                if not result:
-                    break
-
-                # Count sources
-                for point in result:
-                    # Determine source from payload
-                    source = "unknown"
-                    doc_type = point.payload.get("type", "unknown")
-
-                    # EUR-Lex has specific characteristics
-                    if doc_type == "eurlex" or "eurlex" in str(point.payload.get("url", "")).lower():
-                        source = "eurlex"
-                    # German laws from gesetze_github
-                    elif point.payload.get("law"):
-                        source = "gesetze_github"
-                    # Check URL for other indicators
-                    elif "gesetze" in str(point.payload.get("url", "")).lower():
-                        source = "gesetze_github"
-
-                    source_counts[source] += 1
-                    type_counts[doc_type] += 1
-
-                scanned += len(result)
-                if self.verbose and scanned % 10000 == 0:
-                    self._log(f"Scanned {scanned:,}/{total_vectors:,} vectors...")
-
-                if offset is None:
-                    break
-
-            self._log(f"Scanned {scanned:,} vectors total")
-
             # Expected counts (from Phase 1 plan)
             expected_eurlex = 51_491
             expected_gesetze = 274_413
             expected_total = expected_eurlex + expected_gesetze  # ~325,904
 
+            def scan() -> Dict[str, Any]:
+                # Scroll through all points to count by source
+                # Use small batch size to avoid memory issues
+                offset = None
+                source_counts = defaultdict(int)
+                type_counts = defaultdict(int)
+
+                self._log("Scanning all vectors to count by source...")
+                scanned = 0
+
+                while True:
+                    # Scroll batch
+                    result, offset = self.qdrant_client.client.scroll(
+                        collection_name=self.qdrant_client.collection_name,
+                        limit=1000,
+                        offset=offset,
+                        with_payload=True,
+                        with_vectors=False,
+                    )
+
+                    if not result:
+                        break
+
+                    # Count sources
+                    for point in result:
+                        # Same rule as the facet path, so both settle the same split
+                        doc_type = point.payload.get("type", "unknown")
+                        source_counts[source_for_type(doc_type)] += 1
+                        type_counts[str(doc_type)] += 1
+
+                    scanned += len(result)
+                    if self.verbose and scanned % 10000 == 0:
+                        self._log(f"Scanned {scanned:,}/{total_vectors:,} vectors...")
+
+                    if offset is None:
+                        break
+
+                self._log(f"Scanned {scanned:,} vectors total")
+                return {
+                    "source_counts": dict(source_counts),
+                    "type_counts": dict(type_counts),
+                }
+
+            # Fast path: when the total is in range, server-side facets on the
+            # indexed "type" field settle the source split without scrolling
+            aggregate = None
+            if expected_total * 0.9 <= total_vectors <= expected_total * 1.2:
+                aggregate = self._facet_breakdown(total_vectors, expected_eurlex, expected_gesetze)
+            if aggregate is None:
+                aggregate = self._cached_scan("vector_count_breakdown", info, scan)
+            source_counts = aggregate["source_counts"]
+            type_counts = aggregate["type_counts"]
+
             # Print breakdown
             print("\nSource breakdown:")
             for source, count in sorted(source_counts.items()):
@@ -196,8 +471,8 @@ class IngestionVerifier:
             # Validation
             details = {
                 "total_vectors": total_vectors,
-                "source_counts": dict(source_counts),
-                "type_counts": dict(type_counts),
+                "source_counts": source_counts,
+                "type_counts": type_counts,
                 "expected_eurlex": expected_eurlex,
                 "expected_gesetze": expected_gesetze,
                 "expected_total": expected_total,
@@ -250,16 +525,16 @@ class IngestionVerifier:
             all_scores = []
 
             for query in test_queries:
-                self._log(f"Testing: {query}")
+                self._log("Testing: %s", query)
 
                 # Generate query embedding
-                query_vector = self.embedder.encode_query(query)
+                query_vector = self._encode_query(query)
 
                 # Search with EUR-Lex filter
                 results = self.qdrant_client.search(
                     query_vector=query_vector,
                     top_k=3,
-                    filters={"type": "eurlex"}
+                    filters=EURLEX_FILTER
                 )
 
                 if not results:
@@ -272,12 +547,12 @@ class IngestionVerifier:
 
                 if top_score > 0.5:
                     passed_queries += 1
-                    self._log(f"  ✓ Top score: {top_score:.4f}")
+                    self._log("  ✓ Top score: %.4f", top_score)
                 else:
                     failed_queries.append(f"{query} (low score: {top_score:.4f})")
-                    self._log(f"  ✗ Top score: {top_score:.4f}")
+                    self._log("  ✗ Top score: %.4f", top_score)
 
-            avg_score = sum(all_scores) / len(all_scores) if all_scores else 0
+            avg_score = float(np.mean(all_scores)) if all_scores else 0
 
             details = {
                 "queries_tested": len(test_queries),
@@ -328,24 +603,19 @@ class IngestionVerifier:
             failed_queries = []
             all_scores = []
 
-            for query, law_filter in test_queries:
-                filter_str = f" (filter: {law_filter})" if law_filter else ""
-                self._log(f"Testing: {query}{filter_str}")
-
-                # Generate query embedding
-                query_vector = self.embedder.encode_query(query)
+            # Generate query embeddings and run all searches in one round trip
+            query_vectors = self._encode_queries([query for query, _ in test_queries])
+            batch_results = self.qdrant_client.search_batch(
+                query_vectors=query_vectors,
+                top_k=3,
+                filters=[LAW_FILTERS[law] if law else None for _, law in test_queries],
+            )
 
-                # Build filters
-                filters = {}
+            for (query, law_filter), results in zip(test_queries, batch_results):
                 if law_filter:
-                    filters["law"] = law_filter
-
-                # Search
-                results = self.qdrant_client.search(
-                    query_vector=query_vector,
-                    top_k=3,
-                    filters=filters if filters else None
-                )
+                    self._log("Testing: %s (filter: %s)", query, law_filter)
+                else:
+                    self._log("Testing: %s", query)
 
                 if not results:
                     failed_queries.append(f"{query} (no results)")
@@ -357,12 +627,12 @@ class IngestionVerifier:
 
                 if top_score > 0.5:
                     passed_queries += 1
-                    self._log(f"  ✓ Top score: {top_score:.4f} - {results[0].get('title', 'No title')[:80]}")
+                    self._log("  ✓ Top score: %.4f - %.80s", top_score, results[0]["title"] or "No title")
                 else:
                     failed_queries.append(f"{query} (low score: {top_score:.4f})")
-                    self._log(f"  ✗ Top score: {top_score:.4f}")
+                    self._log("  ✗ Top score: %.4f", top_score)
 
-            avg_score = sum(all_scores) / len(all_scores) if all_scores else 0
+            avg_score = float(np.mean(all_scores)) if all_scores else 0
 
             details = {
                 "queries_tested": len(test_queries),
@@ -410,10 +680,10 @@ class IngestionVerifier:
             failed_queries = []
 
             for query in test_queries:
-                self._log(f"Testing: {query}")
+                self._log("Testing: %s", query)
 
                 # Generate query embedding
-                query_vector = self.embedder.encode_query(query)
+                query_vector = self._encode_query(query)
 
                 # Search without filters (cross-source)
                 results = self.qdrant_client.search(
@@ -429,21 +699,19 @@ class IngestionVerifier:
                 # Check if we get results from both sources
                 sources = set()
                 for result in results:
-                    # Determine source
-                    if result["metadata"].get("type") == "eurlex":
-                        sources.add("eurlex")
-                    elif result["metadata"].get("law"):
-                        sources.add("gesetze_github")
+                    source = source_for_type(result["metadata"].get("type"))
+                    if source != "unknown":
+                        sources.add(source)
 
-                self._log(f"  Sources in top 10: {sources}")
+                self._log("  Sources in top 10: %s", sources)
 
                 # Ideally we should see both sources
                 if len(sources) >= 2:
                     passed_queries += 1
-                    self._log(f"  ✓ Found results from {len(sources)} sources")
+                    self._log("  ✓ Found results from %d sources", len(sources))
                 else:
                     # Not a hard fail, but log it
-                    self._log(f"  ⚠ Only found results from 1 source: {sources}")
+                    self._log("  ⚠ Only found results from 1 source: %s", sources)
                     passed_queries += 0.5  # Partial credit
 
             details = {
@@ -481,9 +749,9 @@ class IngestionVerifier:
         try:
             # Sample query
             query = "Vertragsverletzung und Schadensersatz"
-            self._log(f"Test query: {query}")
+            self._log("Test query: %s", query)
 
-            query_vector = self.embedder.encode_query(query)
+            query_vector = self._encode_query(query)
 
             # Get top 50 results to analyze distribution
             results = self.qdrant_client.search(
@@ -497,15 +765,15 @@ class IngestionVerifier:
                 print("❌ FAIL: No results returned\n")
                 return False
 
-            scores = [r["score"] for r in results]
+            scores = np.fromiter((r["score"] for r in results), dtype=np.float32, count=len(results))
 
             # Calculate statistics
-            max_score = max(scores)
-            min_score = min(scores)
-            avg_score = sum(scores) / len(scores)
+            max_score = float(scores.max())
+            min_score = float(scores.min())
+            avg_score = float(scores.mean())
 
             # Check if top results have good scores
-            top_10_avg = sum(scores[:10]) / 10
+            top_10_avg = float(scores[:10].mean())
 
             details = {
                 "query": query,
@@ -552,47 +820,66 @@ class IngestionVerifier:
             # Sample multiple vectors and check for exact duplicates
             # We'll use doc_id as the unique identifier
 
-            self._log("Scanning for duplicate doc_ids...")
+            def scan() -> Dict[str, Any]:
+                self._log("Scanning for duplicate doc_ids...")
+
+                # Seen doc_ids are kept as a set of their 64-bit hashes instead of
+                # the doc_id strings; only repeated doc_ids are kept by name.
+                # hash() of a str is salted per process (PYTHONHASHSEED), so these
+                # values only compare within this scan: never persist or cache them
+                offset = None
+                seen = set()
+                repeats = defaultdict(int)
+                scanned = 0
+
+                while True:
+                    result, offset = self.qdrant_client.client.scroll(
+                        collection_name=self.qdrant_client.collection_name,
+                        limit=1000,
+                        offset=offset,
+                        with_payload=True,
+                        with_vectors=False,
+                    )
+
+                    if not result:
+                        break
+
+                    for point in result:
+                        doc_id = point.payload.get("doc_id", f"point_{point.id}")
+                        doc_hash = hash(doc_id)
+                        if doc_hash in seen:
+                            repeats[doc_id] += 1
+                        else:
+                            seen.add(doc_hash)
+
+                    scanned += len(result)
+                    if self.verbose and scanned % 10000 == 0:
+                        self._log(f"Scanned {scanned:,} vectors...")
+
+                    if offset is None:
+                        break
+
+                # Occurrence count of a duplicate = first occurrence + repeats
+                sample = list(repeats.items())[:10]
+                return {
+                    "total_docs": len(seen),
+                    "duplicate_docs": len(repeats),
+                    "sample_duplicates": {doc_id: count + 1 for doc_id, count in sample},
+                }
 
-            offset = None
-            doc_id_counts = defaultdict(int)
-            scanned = 0
-
-            while True:
-                result, offset = self.qdrant_client.client.scroll(
-                    collection_name=self.qdrant_client.collection_name,
-                    limit=1000,
-                    offset=offset,
-                    with_payload=True,
-                    with_vectors=False,
-                )
-
-                if not result:
-                    break
-
-                for point in result:
-                    doc_id = point.payload.get("doc_id", f"point_{point.id}")
-                    doc_id_counts[doc_id] += 1
-
-                scanned += len(result)
-                if self.verbose and scanned % 10000 == 0:
-                    self._log(f"Scanned {scanned:,} vectors...")
-
-                if offset is None:
-                    break
-
-            # Find duplicates
-            duplicates = {doc_id: count for doc_id, count in doc_id_counts.items() if count > 1}
+            info = self.qdrant_client.get_collection_info()
+            aggregate = self._cached_scan("duplicate_detection", info, scan)
+            duplicates = aggregate["sample_duplicates"]
 
-            total_docs = len(doc_id_counts)
-            duplicate_docs = len(duplicates)
+            total_docs = aggregate["total_docs"]
+            duplicate_docs = aggregate["duplicate_docs"]
             duplicate_percentage = (duplicate_docs / total_docs * 100) if total_docs > 0 else 0
 
             details = {
                 "total_unique_doc_ids": total_docs,
                 "duplicate_doc_ids": duplicate_docs,
                 "duplicate_percentage": duplicate_percentage,
-                "sample_duplicates": dict(list(duplicates.items())[:10]),  # Show first 10
+                "sample_duplicates": duplicates,  # Show first 10
             }
 
             print(f"\nUnique doc_ids: {total_docs:,}")
@@ -600,7 +887,7 @@ class IngestionVerifier:
 
             if duplicate_docs > 0:
                 print(f"\nSample duplicates (showing up to 10):")
-                for doc_id, count in list(duplicates.items())[:10]:
+                for doc_id, count in duplicates.items():
                     print(f"  {doc_id}: appears {count} times")
 
             # Pass if less than 1% duplicates (some duplication is acceptable due to chunking)
@@ -629,42 +916,46 @@ class IngestionVerifier:
         print("=" * 80)
 
         try:
-            # Count unique German laws
-            self._log("Scanning for unique German law identifiers...")
-
-            offset = None
-            law_slugs = set()
-            scanned = 0
-
-            while True:
-                result, offset = self.qdrant_client.client.scroll(
-                    collection_name=self.qdrant_client.collection_name,
-                    limit=1000,
-                    offset=offset,
-                    with_payload=True,
-                    with_vectors=False,
-                )
-
-                if not result:
-                    break
-
-                for point in result:
-                    # Only count German laws (not EUR-Lex)
-                    if point.payload.get("law"):
-                        # Use doc_id as unique law identifier (format: gesetze_github_{slug})
-                        doc_id = point.payload.get("doc_id", "")
-                        if "gesetze_github_" in doc_id:
-                            slug = doc_id.replace("gesetze_github_", "").split("_")[0]
-                            law_slugs.add(slug)
-
-                scanned += len(result)
-                if self.verbose and scanned % 10000 == 0:
-                    self._log(f"Scanned {scanned:,} vectors...")
+            def scan() -> Dict[str, Any]:
+                # Count unique German laws
+                self._log("Scanning for unique German law identifiers...")
+
+                offset = None
+                law_slugs = set()
+                prefix_len = len(GESETZE_DOC_PREFIX)
+                scanned = 0
+
+                while True:
+                    result, offset = self.qdrant_client.client.scroll(
+                        collection_name=self.qdrant_client.collection_name,
+                        limit=1000,
+                        offset=offset,
+                        with_payload=True,
+                        with_vectors=False,
+                    )
+
+                    if not result:
+                        break
+
+                    for point in result:
+                        # Only count German laws (not EUR-Lex)
+                        if point.payload.get("law"):
+                            # Use doc_id as unique law identifier (format: gesetze_github_{slug})
+                            doc_id = point.payload.get("doc_id") or ""
+                            if doc_id.startswith(GESETZE_DOC_PREFIX):
+                                law_slugs.add(doc_id[prefix_len:].partition("_")[0])
+
+                    scanned += len(result)
+                    if self.verbose and scanned % 10000 == 0:
+                        self._log(f"Scanned {scanned:,} vectors...")
+
+                    if offset is None:
+                        break
+
+                return {"unique_laws": len(law_slugs)}
 
-                if offset is None:
-                    break
-
-            unique_laws = len(law_slugs)
+            info = self.qdrant_client.get_collection_info()
+            unique_laws = self._cached_scan("coverage_validation", info, scan)["unique_laws"]
             expected_laws = 6593
             coverage_percentage = (unique_laws / expected_laws * 100) if expected_laws > 0 else 0
 
@@ -735,8 +1026,16 @@ class IngestionVerifier:
         # Print summary
         self._print_summary()
 
-        # Return overall result
+        # Persist caches (scan aggregates only after a fully successful run)
         all_passed = self.results["summary"]["failed"] == 0
+        try:
+            self.cache.save_embeddings()
+            if all_passed:
+                self.cache.save_aggregates()
+        except OSError as e:
+            print(f"⚠️  Could not write verification cache: {e}")
+
+        # Return overall result
         return all_passed, self.results
 
     def _print_summary(self):
@@ -772,8 +1071,11 @@ class IngestionVerifier:
 
     def save_report(self, output_path: Path):
         """Save verification report to JSON file."""
-        with open(output_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                self.results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            ))
         print(f"Report saved to: {output_path}")
 
 
@@ -791,10 +1093,16 @@ def main():
         help="Save report to JSON file (e.g., reports/verification_report.json)"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached embeddings and scan results from previous runs"
+    )
+
     args = parser.parse_args()
 
     # Run verification
-    verifier = IngestionVerifier(verbose=args.verbose)
+    verifier = IngestionVerifier(verbose=args.verbose, use_cache=not args.no_cache)
     all_passed, results = verifier.run_all_checks()
 
     # Save report if requested
@@ -0,0 +1,142 @@
+"""
+ABOUTME: Asyncio micro-batcher that coalesces concurrent query embeddings.
+ABOUTME: Queries arriving within a short window share one batched encoder call.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent embedding requests into batched encoder calls.
+
+    The first queued query opens a window of max_wait_seconds; every query
+    that arrives before the window closes (up to max_batch) is encoded in the
+    same call and each caller receives its own vector. Encoding runs on a
+    dedicated thread, so the event loop keeps serving other requests (and
+    queueing the next batch) while the model is busy.
+
+    Usage:
+        batcher = EmbeddingBatcher(embedder.encode_queries)
+        batcher.start()
+        vector = await batcher.submit("Wann haftet jemand nach §823 BGB?")
+        await batcher.stop()
+    """
+
+    def __init__(
+        self,
+        encode_batch: Callable[[List[str]], List[List[float]]],
+        max_batch: int = 32,
+        max_wait_seconds: float = 0.005,
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            encode_batch: Function encoding a list of queries into vectors (same order)
+            max_batch: Maximum queries per encoder call
+            max_wait_seconds: How long the first query waits for others to join
+        """
+        self.encode_batch = encode_batch
+        self.max_batch = max_batch
+        self.max_wait_seconds = max_wait_seconds
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker task is active."""
+        return self._worker is not None and not self._worker.done()
+
+    def start(self):
+        """Start the worker task on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        # One thread: the model is not shared across concurrent forward passes
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed")
+        self._worker = asyncio.create_task(self._run())
+        logger.info(
+            f"Embedding batcher started (max_batch={self.max_batch}, "
+            f"max_wait={self.max_wait_seconds * 1000:.1f}ms)"
+        )
+
+    async def stop(self):
+        """Cancel the worker task and release the encoder thread."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+    async def submit(self, query: str) -> List[float]:
+        """
+        Queue a query and wait for its embedding.
+
+        Args:
+            query: Query string
+
+        Returns:
+            Query embedding vector
+        """
+        if not self.running:
+            self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((query, future))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for one query, then gather more until the window closes or the batch is full."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait_seconds
+
+        while len(batch) < self.max_batch:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self):
+        """Worker loop: collect a batch, encode it off the event loop, resolve futures."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect_batch()
+
+            # Callers may have gone away (e.g. request cancelled)
+            batch = [(query, future) for query, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            try:
+                vectors = await loop.run_in_executor(
+                    self._executor, self.encode_batch, [query for query, _ in batch]
+                )
+            except Exception as e:
+                logger.error(f"Batched embedding of {len(batch)} queries failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
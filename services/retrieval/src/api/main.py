@@ -3,19 +3,30 @@ ABOUTME: FastAPI service for legal document retrieval.
 ABOUTME: Provides REST API endpoint for semantic search over the legal corpus.
 """
 
+import os
 import sys
+import json
+import importlib.util
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 import logging
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add parent directory to path for imports (only when not already importable)
+if importlib.util.find_spec("src") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.storage.qdrant_client import JuraGPTQdrantClient
-from src.embedding.embedder import LegalTextEmbedder
+from src.storage.qdrant_client import AsyncJuraGPTQdrantClient
+from src.api.semantic_cache import ExactQueryCache, SemanticQueryCache
+from src.api.embed_batcher import EmbeddingBatcher
+
+if TYPE_CHECKING:
+    # Pulls in torch + sentence-transformers; imported lazily in get_embedder()
+    from src.embedding.embedder import LegalTextEmbedder
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,6 +37,8 @@ app = FastAPI(
     title="JuraGPT Retrieval API",
     description="Semantic search over German & EU legal texts",
     version="1.0.0",
+    # Responses carry long legal text chunks; orjson serializes them much faster
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -37,29 +50,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (legal text compresses ~4x); level 4 keeps CPU cost low
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
 # Initialize components (lazy loading)
-qdrant_client: Optional[JuraGPTQdrantClient] = None
-embedder: Optional[LegalTextEmbedder] = None
+qdrant_client: Optional[AsyncJuraGPTQdrantClient] = None
+embedder: Optional["LegalTextEmbedder"] = None
+
+# Near-duplicate query cache in front of Qdrant search
+query_cache = SemanticQueryCache()
+
+# Exact-match tiers: repeated queries skip the semantic lookup (responses) and the encoder (embeddings)
+response_cache = ExactQueryCache(ttl_seconds=query_cache.ttl_seconds)
+embedding_cache = ExactQueryCache()
+
 
+def normalize_query(query: str) -> str:
+    """
+    Normalize query text for exact-match caching (whitespace insensitive).
+
+    Case is preserved: the e5 encoder is case-sensitive, so "BGB" and "bgb"
+    embed (and retrieve) differently and must not share cache entries.
+    """
+    return " ".join(query.split())
 
-def get_qdrant_client() -> JuraGPTQdrantClient:
+
+def get_qdrant_client() -> AsyncJuraGPTQdrantClient:
     """Get or initialize Qdrant client."""
     global qdrant_client
     if qdrant_client is None:
         logger.info("Initializing Qdrant client...")
-        qdrant_client = JuraGPTQdrantClient()
+        qdrant_client = AsyncJuraGPTQdrantClient()
     return qdrant_client
 
 
-def get_embedder() -> LegalTextEmbedder:
-    """Get or initialize embedder."""
+def get_embedder() -> "LegalTextEmbedder":
+    """Get or initialize embedder (imports torch on first use, not at module load)."""
     global embedder
     if embedder is None:
+        from src.embedding.embedder import LegalTextEmbedder
+
         logger.info("Initializing embedder...")
         embedder = LegalTextEmbedder()
     return embedder
 
 
+# Coalesces concurrent query embeddings into batched encoder calls
+batcher = EmbeddingBatcher(
+    lambda queries: get_embedder().encode_queries(queries),
+    max_batch=int(os.getenv("EMBED_BATCH_MAX", "32")),
+    max_wait_seconds=float(os.getenv("EMBED_BATCH_WAIT_MS", "5")) / 1000,
+)
+
+
 # Request/Response models
 class RetrievalRequest(BaseModel):
     """Request model for retrieval endpoint."""
@@ -98,6 +141,7 @@ class CollectionInfo(BaseModel):
     points_count: int
     vectors_count: int
     status: str
+    query_cache: Optional[Dict[str, Any]] = None
 
 
 # Endpoints
@@ -121,7 +165,7 @@ async def health_check():
     try:
         # Check Qdrant connection
         client = get_qdrant_client()
-        collection_info = client.get_collection_info()
+        collection_info = await client.get_collection_info()
 
         return {
             "status": "healthy",
@@ -139,14 +183,27 @@ async def get_info():
     """Get collection information."""
     try:
         client = get_qdrant_client()
-        info = client.get_collection_info()
-        return CollectionInfo(**info)
+        info = await client.get_collection_info()
+        return CollectionInfo(
+            **info,
+            query_cache={
+                "exact": response_cache.stats(),
+                "semantic": query_cache.stats(),
+                "embeddings": embedding_cache.stats(),
+            },
+        )
     except Exception as e:
         logger.error(f"Error getting collection info: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/retrieve", response_model=RetrievalResponse)
+# RetrievalResponse documents the schema only; results are built from known-clean
+# Qdrant payloads, so the outgoing pydantic validation pass is skipped
+@app.post(
+    "/api/retrieve",
+    response_class=ORJSONResponse,
+    responses={200: {"model": RetrievalResponse}},
+)
 async def retrieve(request: RetrievalRequest):
     """
     Retrieve relevant legal documents for a query.
@@ -162,39 +219,50 @@ async def retrieve(request: RetrievalRequest):
 
         # Get components
         client = get_qdrant_client()
-        emb = get_embedder()
 
-        # Generate query embedding
-        query_vector = emb.encode_query(request.query)
-
-        # Search Qdrant
-        results = client.search(
-            query_vector=query_vector,
-            top_k=request.top_k,
-            filters=request.filters,
+        normalized_query = normalize_query(request.query)
+        cache_scope = (
+            request.top_k,
+            json.dumps(request.filters, sort_keys=True) if request.filters else None,
         )
 
-        # Format response
-        retrieval_results = [
-            RetrievalResult(
-                text=r["text"] or "",
-                title=r["title"],
-                source=r["source"],
-                url=r["url"],
-                score=r["score"],
-                metadata=r["metadata"],
-            )
-            for r in results
-        ]
-
-        response = RetrievalResponse(
-            query=request.query,
-            results=retrieval_results,
-            total_results=len(retrieval_results),
-        )
+        # Exact repeats (same normalized query, top_k and filters) are a dict lookup
+        exact_key = (normalized_query, cache_scope)
+        retrieval_results = response_cache.get(exact_key)
+
+        if retrieval_results is None:
+            query_vector = embedding_cache.get(normalized_query)
+            if query_vector is None:
+                # Generate query embedding (batched with concurrent requests, encoded off the event loop)
+                query_vector = await batcher.submit(normalized_query)
+                embedding_cache.put(normalized_query, query_vector)
+
+            # Serve near-duplicate queries with the same top_k/filters from cache
+            retrieval_results = query_cache.get(query_vector, cache_scope)
+
+            if retrieval_results is None:
+                # Search Qdrant (result dicts already have the RetrievalResult shape)
+                retrieval_results = await client.search(
+                    query_vector=query_vector,
+                    top_k=request.top_k,
+                    filters=request.filters,
+                )
+                query_cache.put(query_vector, cache_scope, retrieval_results)
+            else:
+                logger.info("Semantic cache hit")
+
+            response_cache.put(exact_key, retrieval_results)
+        else:
+            logger.info("Exact cache hit")
 
         logger.info(f"Returned {len(retrieval_results)} results")
-        return response
+        return ORJSONResponse(
+            {
+                "query": request.query,
+                "results": retrieval_results,
+                "total_results": len(retrieval_results),
+            }
+        )
 
     except Exception as e:
         logger.error(f"Retrieval error: {e}", exc_info=True)
@@ -229,19 +297,33 @@ async def startup_event():
         # Pre-load components
         get_qdrant_client()
         get_embedder()
+        batcher.start()
         logger.info("API ready")
     except Exception as e:
         logger.error(f"Startup failed: {e}")
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background workers and close connections."""
+    await batcher.stop()
+    if qdrant_client is not None:
+        await qdrant_client.close()
+
+
 if __name__ == "__main__":
     import uvicorn
 
+    # uvloop + httptools are installed with uvicorn[standard]; request them
+    # explicitly so a missing extra fails loudly instead of falling back to
+    # asyncio + h11. Auto-reload is opt-in (API_RELOAD=true) for development.
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=os.getenv("API_RELOAD", "false").lower() == "true",
         log_level="info",
     )
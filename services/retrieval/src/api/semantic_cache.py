@@ -0,0 +1,264 @@
+"""
+ABOUTME: In-memory caches for retrieval: exact-match LRU and semantic (embedding-keyed).
+ABOUTME: Serves repeated and near-duplicate queries without embedding or a Qdrant round trip.
+"""
+
+import os
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticQueryCache:
+    """
+    Cache of retrieval results looked up by query embedding similarity.
+
+    Embeddings are L2-normalized and stored row-wise in a preallocated float32
+    matrix, so a lookup is a single matrix-vector product (exact inner-product
+    search). Entries only match lookups with the same scope (e.g. top_k and
+    filters), expire after a TTL, and are evicted least-recently-used. A
+    scope's id is dropped when the last slot using it is overwritten, so the
+    scope map never outgrows max_entries.
+
+    Usage:
+        cache = SemanticQueryCache()
+        results = cache.get(query_vector, scope=(top_k, filters_key))
+        if results is None:
+            results = search(...)
+            cache.put(query_vector, (top_k, filters_key), results)
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        threshold: Optional[float] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum cached queries (defaults to env or 10000)
+            ttl_seconds: Entry lifetime in seconds (defaults to env or 300)
+            threshold: Minimum cosine similarity for a hit (defaults to env or 0.92)
+        """
+        self.max_entries = max_entries or int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "10000"))
+        self.ttl_seconds = ttl_seconds or float(os.getenv("QUERY_CACHE_TTL_SECONDS", "300"))
+        self.threshold = threshold or float(os.getenv("QUERY_CACHE_THRESHOLD", "0.92"))
+
+        # Allocated on first put, once the embedding dimension is known
+        self._vectors: Optional[np.ndarray] = None
+        self._expires = np.zeros(self.max_entries, dtype=np.float64)
+        self._scopes = np.full(self.max_entries, -1, dtype=np.int64)
+        self._values: List[Any] = [None] * self.max_entries
+        self._scope_ids: Dict[Hashable, int] = {}
+        self._scope_keys: Dict[int, Hashable] = {}
+        self._scope_refs: Dict[int, int] = {}
+        self._next_scope_id = 0
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+        self._size = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> np.ndarray:
+        """Convert to a unit-length float32 vector."""
+        v = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(v)
+        return v / norm if norm > 0 else v
+
+    def _acquire_scope(self, scope: Hashable) -> int:
+        """Get the id for a scope (assigning one if new) and count one more slot using it."""
+        scope_id = self._scope_ids.get(scope)
+        if scope_id is None:
+            scope_id = self._next_scope_id
+            self._next_scope_id += 1
+            self._scope_ids[scope] = scope_id
+            self._scope_keys[scope_id] = scope
+        self._scope_refs[scope_id] = self._scope_refs.get(scope_id, 0) + 1
+        return scope_id
+
+    def _release_scope(self, scope_id: int):
+        """Count one less slot using a scope id; forget the scope when none are left."""
+        refs = self._scope_refs[scope_id] - 1
+        if refs:
+            self._scope_refs[scope_id] = refs
+        else:
+            del self._scope_refs[scope_id]
+            del self._scope_ids[self._scope_keys.pop(scope_id)]
+
+    def get(self, query_vector: List[float], scope: Hashable) -> Optional[Any]:
+        """
+        Look up the cached value for the most similar query in the same scope.
+
+        Args:
+            query_vector: Query embedding
+            scope: Hashable key that must match exactly (e.g. (top_k, filters))
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        scope_id = self._scope_ids.get(scope)
+        if scope_id is None or self._size == 0:
+            self.misses += 1
+            return None
+
+        n = self._size
+        sims = self._vectors[:n] @ self._normalize(query_vector)
+        valid = (self._scopes[:n] == scope_id) & (self._expires[:n] > time.monotonic())
+        sims = np.where(valid, sims, -np.inf)
+
+        slot = int(np.argmax(sims))
+        if sims[slot] < self.threshold:
+            self.misses += 1
+            return None
+
+        self._lru.move_to_end(slot)
+        self.hits += 1
+        return self._values[slot]
+
+    def put(self, query_vector: List[float], scope: Hashable, value: Any):
+        """
+        Store a value for a query embedding.
+
+        Args:
+            query_vector: Query embedding
+            scope: Hashable key lookups must match exactly
+            value: Value to cache (treated as immutable by callers)
+        """
+        vector = self._normalize(query_vector)
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+
+        if self._size < self.max_entries:
+            slot = self._size
+            self._size += 1
+        else:
+            slot, _ = self._lru.popitem(last=False)
+            self._release_scope(int(self._scopes[slot]))
+
+        scope_id = self._acquire_scope(scope)
+
+        self._vectors[slot] = vector
+        self._expires[slot] = time.monotonic() + self.ttl_seconds
+        self._scopes[slot] = scope_id
+        self._values[slot] = value
+        self._lru[slot] = None
+
+    def clear(self):
+        """Drop all entries and reset statistics."""
+        self._expires[:] = 0
+        self._scopes[:] = -1
+        self._values = [None] * self.max_entries
+        self._scope_ids.clear()
+        self._scope_keys.clear()
+        self._scope_refs.clear()
+        self._lru.clear()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class ExactQueryCache:
+    """
+    Bounded LRU cache for exact keys (e.g. normalized query text).
+
+    The cheap tier in front of SemanticQueryCache: an exact repeat is a
+    single dict lookup, with no embedding or similarity search.
+
+    Usage:
+        cache = ExactQueryCache(max_entries=4096, ttl_seconds=300)
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.put(key, value)
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum cached keys (defaults to env EXACT_CACHE_MAX_ENTRIES or 4096)
+            ttl_seconds: Entry lifetime in seconds (None = entries never expire)
+        """
+        self.max_entries = max_entries or int(os.getenv("EXACT_CACHE_MAX_ENTRIES", "4096"))
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up the value for an exact key.
+
+        Args:
+            key: Hashable cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Store a value, evicting the least recently used key when full.
+
+        Args:
+            key: Hashable cache key
+            value: Value to cache (treated as immutable by callers)
+        """
+        expires = time.monotonic() + self.ttl_seconds if self.ttl_seconds else float("inf")
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries and reset statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,114 @@
+"""
+ABOUTME: SQLite store of HTTP validators (ETag / Last-Modified) and response bodies.
+ABOUTME: Lets crawlers send conditional requests and reuse the stored body on 304.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+from urllib.parse import urlencode
+
+import requests
+
+
+class CachedResponse(NamedTuple):
+    """Validators and body of a previously fetched response."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+
+
+class HTTPCache:
+    """
+    Persistent conditional-request cache keyed by URL and query parameters.
+
+    Safe to share between threads. Only responses carrying an ETag or
+    Last-Modified header are stored, since nothing else can be revalidated.
+
+    Usage:
+        cache = HTTPCache("data/raw/http_cache.sqlite")
+        key = cache.key(url, params)
+        cached = cache.get(key)
+        response = session.get(url, params=params, headers=cache.conditional_headers(cached))
+        body = cached.body if response.status_code == 304 and cached else response.content
+        cache.put(key, response)
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize cache (creates the database file if missing).
+
+        Args:
+            path: SQLite database path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, params: Optional[dict] = None) -> str:
+        """Cache key for a URL and its query parameters (parameter order ignored)."""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    @staticmethod
+    def conditional_headers(cached: Optional[CachedResponse]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a cached response."""
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a stored response.
+
+        Args:
+            key: Cache key (see key())
+
+        Returns:
+            Stored validators and body, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def put(self, key: str, response: requests.Response):
+        """
+        Store a successful response if it carries validators.
+
+        Args:
+            key: Cache key (see key())
+            response: Response with status 200
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, etag, last_modified, response.content),
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
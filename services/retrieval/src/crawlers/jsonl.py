@@ -0,0 +1,59 @@
+"""
+ABOUTME: Shared JSONL reader/writer for crawler output files.
+ABOUTME: orjson encoding, optional gzip compression (".gz" suffix) and mmap reads.
+"""
+
+import gzip
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+import orjson
+
+# Fast gzip level for *.jsonl.gz output: most of the size win at a fraction of level 9's CPU
+JSONL_GZIP_LEVEL = 3
+
+
+def write_jsonl(path: Path, documents: Iterable[Dict[str, Any]]):
+    """
+    Write documents as JSONL, one document per line.
+
+    Args:
+        path: Output file (".gz" suffix writes gzip-compressed JSONL)
+        documents: Document dictionaries
+    """
+    # A ".gz" filename writes gzip-compressed JSONL (legal prose compresses ~6-10x)
+    if path.suffix == ".gz":
+        f = gzip.open(path, "wb", compresslevel=JSONL_GZIP_LEVEL)
+    else:
+        f = open(path, "wb")
+
+    with f:
+        f.writelines(orjson.dumps(doc, option=orjson.OPT_APPEND_NEWLINE) for doc in documents)
+
+
+def read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """
+    Read all documents of a JSONL file (blank lines are skipped).
+
+    Args:
+        path: Input file (".gz" suffix reads gzip-compressed JSONL)
+
+    Returns:
+        List of documents, in file order
+    """
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as f:
+            raw = f.read()
+    else:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raw = b""
+            else:
+                # One read of the mapped file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    raw = mm[:]
+
+    # One split; blank lines are skipped without scanning non-blank ones
+    return [orjson.loads(line) for line in raw.split(b"\n") if line and not line.isspace()]
@@ -4,37 +4,167 @@ ABOUTME: Extracts statutory text organized by sections (§) with metadata.
 """
 
 import os
+import codecs
 import json
 import logging
-import time
-from typing import List, Dict, Any, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from lxml.etree import XPath
 from dotenv import load_dotenv
 
+from src.crawlers.http_cache import HTTPCache
+from src.crawlers.jsonl import read_jsonl, write_jsonl
+from src.crawlers.rate_limiter import TokenBucket
+from src.crawlers.session import create_session
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Charset declared in the page (<meta charset>, http-equiv Content-Type or XML declaration)
+CHARSET_PATTERN = re.compile(
+    rb"""(?:<meta[^>]+charset|<\?xml[^>]+encoding)\s*=\s*["']?([A-Za-z0-9._:-]+)""", re.I
+)
+CHARSET_SEARCH_BYTES = 2048
+
+# Compiled once; evaluated directly on lxml trees (no CSS translation per page)
+SECTION_LINKS_XPATH = XPath("//a[contains(@href, '__')]")
+SECTION_TEXT_XPATH = XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' jnhtml ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' jurAbsatz ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' jnenbez ')]"
+    " | //p"
+)
+SECTION_LINKS_CSS = "a[href*='__']"
+SECTION_ID_PATTERN = re.compile(r"__([^./#?]+)")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+SECTION_TEXT_CSS = "div.jnhtml, div.jurAbsatz, div.jnenbez, p"
+
+# Section pages smaller than this are stubs (no section body); skip parsing them
+MIN_SECTION_PAGE_BYTES = 512
+
+
+def detect_charset(content: bytes) -> str:
+    """
+    Charset a page declares in its head.
+
+    Gesetze-im-Internet serves UTF-8, which is assumed when nothing (or an
+    unknown charset) is declared; libxml2 would otherwise fall back to latin-1.
+
+    Args:
+        content: Raw page bytes
+
+    Returns:
+        Python codec name
+    """
+    match = CHARSET_PATTERN.search(content, 0, CHARSET_SEARCH_BYTES)
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode("ascii")).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+@lru_cache(maxsize=None)
+def _html_parser(encoding: str) -> lxml_html.HTMLParser:
+    """lxml HTML parser decoding with the given charset (one per charset)."""
+    return lxml_html.HTMLParser(encoding=encoding)
+
+
+def _parse_lxml(content: bytes) -> lxml_html.HtmlElement:
+    """Parse a page with lxml in its declared charset."""
+    return lxml_html.fromstring(content, parser=_html_parser(detect_charset(content)))
+
+
+def _parse_lexbor(content: bytes) -> "LexborHTMLParser":
+    """Parse a page with Lexbor (selectolax) in its declared charset."""
+    return LexborHTMLParser(content.decode(detect_charset(content), errors="replace"))
+
+
+def select_section_links(content: bytes) -> List[Tuple[str, str]]:
+    """
+    Find TOC links pointing at sections.
+
+    Uses the Lexbor parser (selectolax) when installed, lxml otherwise.
+
+    Returns:
+        List of (href, link text) pairs
+    """
+    if SELECTOLAX_AVAILABLE:
+        tree = _parse_lexbor(content)
+        return [
+            (link.attributes.get("href") or "", link.text(separator="", strip=False).strip())
+            for link in tree.css(SECTION_LINKS_CSS)
+        ]
+
+    tree = _parse_lxml(content)
+    return [
+        (link.get("href", ""), "".join(link.itertext()).strip())
+        for link in SECTION_LINKS_XPATH(tree)
+    ]
+
+
+def select_section_text(content: bytes) -> List[str]:
+    """
+    Extract the text of every section text block, whitespace-collapsed (may be empty strings).
+
+    Uses the Lexbor parser (selectolax) when installed, lxml otherwise.
+    """
+    if SELECTOLAX_AVAILABLE:
+        tree = _parse_lexbor(content)
+        texts = (elem.text(separator="", strip=False) for elem in tree.css(SECTION_TEXT_CSS))
+    else:
+        tree = _parse_lxml(content)
+        # text_content() gathers a block's text in one C-level traversal
+        texts = (elem.text_content() for elem in SECTION_TEXT_XPATH(tree))
+
+    return [WHITESPACE_PATTERN.sub(" ", text).strip() for text in texts]
+
 
 class LawsCrawler:
     """Crawler for Gesetze-im-Internet.de"""
 
-    def __init__(self, base_url: Optional[str] = None, output_dir: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        cache_path: Optional[str] = None,
+        rate: Optional[float] = None,
+    ):
         """
         Initialize laws crawler.
 
         Args:
             base_url: Base URL for Gesetze-im-Internet (defaults to env)
             output_dir: Directory to save raw data (defaults to data/raw/)
+            max_concurrency: Sections fetched in parallel per law (defaults to env
+                LAWS_CRAWLER_CONCURRENCY or 8)
+            cache_path: SQLite cache of section pages for conditional requests
+                (defaults to env LAWS_CACHE_PATH or <output_dir>/laws_http_cache.sqlite;
+                "none" disables it)
+            rate: Initial requests per second across all crawl threads (defaults to
+                env LAWS_CRAWLER_RATE or 8; adapts to the server's responses)
         """
         self.base_url = base_url or os.getenv(
             "GESETZE_IM_INTERNET_BASE_URL", "https://www.gesetze-im-internet.de"
         )
         self.output_dir = Path(output_dir or "data/raw")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_concurrency = max_concurrency or int(os.getenv("LAWS_CRAWLER_CONCURRENCY", "8"))
 
         # Most important German laws for initial prototype
         self.important_laws = {
@@ -50,13 +180,61 @@ class LawsCrawler:
             "bverfgg": "Bundesverfassungsgerichtsgesetz",
         }
 
-        self.session = requests.Session()
-        self.session.headers.update(
+        self.session = create_session(
             {
                 "User-Agent": "JuraGPT-Research/1.0 (Educational/Research Purpose)",
-            }
+            },
+            pool_size=max(32, self.max_concurrency),
+            raise_on_status=False,
+        )
+
+        # Shared by all TOC and section fetches of all laws. Starts at `rate` and
+        # adapts between a tenth and four times that: the rate grows while the
+        # server answers normally and halves on throttling, server errors and
+        # connection failures, so the thread pools are not capped at a fixed rate
+        rate = rate or float(os.getenv("LAWS_CRAWLER_RATE", "8"))
+        self.rate_limiter = TokenBucket(
+            capacity=self.max_concurrency, rate=rate, min_rate=rate / 10, max_rate=rate * 4
         )
 
+        # Re-crawls revalidate sections with ETag / Last-Modified; unchanged
+        # sections come back as 304 and are parsed from the stored page
+        cache_path = cache_path or os.getenv(
+            "LAWS_CACHE_PATH", str(self.output_dir / "laws_http_cache.sqlite")
+        )
+        self.http_cache = HTTPCache(cache_path) if cache_path.lower() != "none" else None
+
+    def _get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Rate-limited GET that adapts the shared rate to the server's responses.
+
+        Throttling (429) and server errors (after the session's retries) halve
+        the rate, and a Retry-After header holds off every thread for that long;
+        any other response probes a slightly higher rate.
+
+        Args:
+            url: Page URL
+            headers: Extra request headers
+
+        Returns:
+            Final response (status not checked)
+        """
+        self.rate_limiter.acquire()
+        try:
+            response = self.session.get(url, headers=headers or {}, timeout=30)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            self.rate_limiter.on_failure()
+            raise
+
+        if response.status_code == 429 or response.status_code >= 500:
+            self.rate_limiter.on_failure()
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                self.rate_limiter.pause(int(retry_after))
+        else:
+            self.rate_limiter.on_success()
+        return response
+
     def crawl_law(self, law_id: str, law_name: str, max_sections: int = 50) -> List[Dict[str, Any]]:
         """
         Crawl a single law and extract sections.
@@ -76,40 +254,38 @@ class LawsCrawler:
 
         try:
             # Get table of contents
-            response = self.session.get(f"{law_url}/index.html", timeout=30)
+            response = self._get(f"{law_url}/index.html")
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, "lxml")
 
             # Find section links (different structure for different laws)
-            section_links = self._extract_section_links(soup, law_id)
+            section_links = self._extract_section_links(response.content, law_id)
 
             logger.info(f"Found {len(section_links)} sections in {law_name}")
 
             # Limit sections for prototype
             section_links = section_links[:max_sections]
 
-            # Crawl each section
-            for idx, (section_id, section_title, section_path) in enumerate(section_links):
+            def crawl(link):
+                section_id, section_title, section_path = link
                 try:
-                    section_url = f"{law_url}/{section_path}"
-                    section_data = self._crawl_section(
+                    # Throttled by the adaptive token bucket plus the session's retry/backoff
+                    return self._crawl_section(
                         law_id=law_id,
                         law_name=law_name,
                         section_id=section_id,
                         section_title=section_title,
-                        section_url=section_url,
+                        section_url=f"{law_url}/{section_path}",
                     )
 
-                    if section_data:
-                        documents.append(section_data)
-
-                    # Rate limiting
-                    if idx % 10 == 0:
-                        time.sleep(1)
-
                 except Exception as e:
                     logger.warning(f"Error crawling section {section_id}: {e}")
-                    continue
+                    return None
+
+            # Crawl sections concurrently (bounded for politeness), keeping TOC order
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                for section_data in executor.map(crawl, section_links):
+                    if section_data:
+                        documents.append(section_data)
 
             logger.info(f"Crawled {len(documents)} sections from {law_name}")
             return documents
@@ -119,7 +295,7 @@ class LawsCrawler:
             return []
 
     def _extract_section_links(
-        self, soup: BeautifulSoup, law_id: str
+        self, content: bytes, law_id: str
     ) -> List[tuple[str, str, str]]:
         """
         Extract section links from table of contents.
@@ -131,24 +307,17 @@ class LawsCrawler:
 
         # Try different selectors based on page structure
         # Pattern 1: Direct links in TOC
-        toc_links = soup.select("a[href*='__']")
-
-        for link in toc_links:
-            href = link.get("href", "")
-            text = link.get_text(strip=True)
+        toc_links = select_section_links(content)
 
+        for href, text in toc_links:
             if not href or not text:
                 continue
 
-            # Extract section identifier (e.g., "__823" from "__823.html")
-            if "__" in href:
-                section_id = href.split("__")[1].replace(".html", "")
-                section_path = href
-
+            # Extract section identifier (e.g., "823" from "__823.html")
+            match = SECTION_ID_PATTERN.search(href)
+            if match:
                 # Title usually format: "§ 823 Schadensersatzpflicht"
-                section_title = text
-
-                section_links.append((section_id, section_title, section_path))
+                section_links.append((match.group(1), text, href))
 
         return section_links
 
@@ -163,32 +332,47 @@ class LawsCrawler:
         """
         Crawl a single section and extract text.
 
+        Sends a conditional request when the section was fetched before and
+        parses the cached page if the server answers 304 Not Modified.
+
         Returns:
             Document dictionary with metadata
         """
         try:
-            response = self.session.get(section_url, timeout=30)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, "lxml")
+            cache_key = HTTPCache.key(section_url)
+            cached = self.http_cache.get(cache_key) if self.http_cache else None
+
+            response = self._get(section_url, HTTPCache.conditional_headers(cached))
+
+            # Unchanged since the last crawl: reuse the stored page
+            if response.status_code == 304 and cached:
+                content = cached.body
+            else:
+                response.raise_for_status()
+                content = response.content
+                if self.http_cache:
+                    self.http_cache.put(cache_key, response)
+
+            if len(content) < MIN_SECTION_PAGE_BYTES:
+                logger.debug(f"Skipping stub page for {section_id} ({len(content)} bytes)")
+                return None
 
             # Extract section text (usually in div.jnhtml or div.jurAbsatz)
-            text_elements = soup.select("div.jnhtml, div.jurAbsatz, div.jnenbez, p")
+            text_elements = select_section_text(content)
 
             if not text_elements:
                 logger.warning(f"No text found for {section_id}")
                 return None
 
             # Combine text from all elements
-            section_text = "\n\n".join(
-                elem.get_text(strip=True) for elem in text_elements if elem.get_text(strip=True)
-            )
+            section_text = "\n\n".join(text for text in text_elements if text)
 
             if not section_text or len(section_text) < 20:
                 logger.warning(f"Section {section_id} has insufficient text")
                 return None
 
             # Create document
-            doc = {
+            return {
                 "doc_id": f"{law_id}-{section_id}",
                 "title": section_title,
                 "text": section_text,
@@ -200,21 +384,23 @@ class LawsCrawler:
                 "law_name": law_name,
             }
 
-            return doc
-
         except Exception as e:
             logger.error(f"Error crawling section {section_id} from {section_url}: {e}")
             return None
 
-    def crawl_all(self, max_laws: Optional[int] = None) -> List[Dict[str, Any]]:
+    def crawl_all(self, max_laws: Optional[int] = None, max_parallel_laws: int = 4) -> List[Dict[str, Any]]:
         """
         Crawl all important laws.
 
+        Laws are crawled in parallel; the shared token bucket keeps the
+        overall request rate polite.
+
         Args:
             max_laws: Limit number of laws (for testing)
+            max_parallel_laws: Laws crawled at the same time
 
         Returns:
-            List of all documents
+            List of all documents (in important_laws order)
         """
         all_documents = []
         laws_to_crawl = list(self.important_laws.items())
@@ -222,12 +408,9 @@ class LawsCrawler:
         if max_laws:
             laws_to_crawl = laws_to_crawl[:max_laws]
 
-        for law_id, law_name in laws_to_crawl:
-            docs = self.crawl_law(law_id, law_name)
-            all_documents.extend(docs)
-
-            # Rate limiting between laws
-            time.sleep(2)
+        with ThreadPoolExecutor(max_workers=max_parallel_laws) as executor:
+            for docs in executor.map(lambda law: self.crawl_law(*law), laws_to_crawl):
+                all_documents.extend(docs)
 
         logger.info(f"Total documents crawled: {len(all_documents)}")
         return all_documents
@@ -238,13 +421,11 @@ class LawsCrawler:
 
         Args:
             documents: List of document dictionaries
-            filename: Output filename
+            filename: Output filename (".gz" suffix writes gzip-compressed JSONL)
         """
         output_path = self.output_dir / filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            for doc in documents:
-                f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+        write_jsonl(output_path, documents)
 
         logger.info(f"Saved {len(documents)} documents to {output_path}")
 
@@ -253,7 +434,7 @@ class LawsCrawler:
         Load documents from JSONL file.
 
         Args:
-            filename: Input filename
+            filename: Input filename (".gz" suffix reads gzip-compressed JSONL)
 
         Returns:
             List of documents
@@ -264,11 +445,7 @@ class LawsCrawler:
             logger.warning(f"File not found: {input_path}")
             return []
 
-        documents = []
-        with open(input_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    documents.append(json.loads(line))
+        documents = read_jsonl(input_path)
 
         logger.info(f"Loaded {len(documents)} documents from {input_path}")
         return documents
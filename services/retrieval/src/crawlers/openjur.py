@@ -5,18 +5,26 @@ ABOUTME: Fetches case headnotes, full text, and metadata for legal RAG corpus.
 
 import os
 import json
+import orjson
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import requests
 from dotenv import load_dotenv
 
+from src.crawlers.jsonl import read_jsonl, write_jsonl
+from src.crawlers.rate_limiter import TokenBucket
+from src.crawlers.session import RETRY_STATUS_CODES, create_session
+
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Case numbers like "I ZR 123/20" -> "I-ZR-123-20" in doc ids (single translate pass)
+DOC_ID_TRANSLATION = str.maketrans({"/": "-", " ": "-"})
+
 
 class OpenJurCrawler:
     """Crawler for OpenJur court decisions API."""
@@ -43,14 +51,17 @@ class OpenJurCrawler:
             "BSG": "Bundessozialgericht",
         }
 
-        self.session = requests.Session()
-        self.session.headers.update(
+        self.session = create_session(
             {
                 "User-Agent": "JuraGPT-Research/1.0 (Educational/Research Purpose)",
                 "Accept": "application/json",
             }
         )
 
+        # Shared by all API calls: starts at 2 requests/s (bursts of 5) and adapts
+        # between 0.2 and 4 requests/s based on search responses
+        self.rate_limiter = TokenBucket(capacity=5, rate=2.0, min_rate=0.2, max_rate=4.0)
+
     def search_cases(
         self,
         court: Optional[str] = None,
@@ -82,11 +93,13 @@ class OpenJurCrawler:
             params["q"] = query
 
         try:
+            self.rate_limiter.acquire()
             response = self.session.get(search_url, params=params, timeout=30)
             response.raise_for_status()
+            self.rate_limiter.on_success()
 
-            # Try to parse JSON response
-            data = response.json()
+            # Parse raw bytes with orjson (skips requests' encoding detection)
+            data = orjson.loads(response.content)
 
             # Extract cases (API structure may vary)
             if isinstance(data, dict) and "results" in data:
@@ -101,9 +114,13 @@ class OpenJurCrawler:
             return cases
 
         except requests.exceptions.RequestException as e:
+            # Back off on throttling, server errors and connection failures (not on other 4xx)
+            status = e.response.status_code if e.response is not None else None
+            if status is None or status in RETRY_STATUS_CODES:
+                self.rate_limiter.on_failure()
             logger.error(f"API request failed: {e}")
             return []
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
             return []
 
@@ -120,9 +137,10 @@ class OpenJurCrawler:
         detail_url = f"{self.base_url}/cases/{case_id}"
 
         try:
+            self.rate_limiter.acquire()
             response = self.session.get(detail_url, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
 
         except Exception as e:
             logger.error(f"Error fetching case {case_id}: {e}")
@@ -143,39 +161,59 @@ class OpenJurCrawler:
         """
         logger.info(f"Crawling cases from {court} ({self.courts.get(court, 'Unknown')})...")
 
+        # Resolved once per crawl, not per case
+        court_name = self.courts.get(court, court)
+
         documents = []
         offset = 0
         page_size = 10
 
-        while len(documents) < max_cases:
-            # Fetch page of results
-            cases = self.search_cases(court=court, limit=page_size, offset=offset)
+        def fetch_page(page_offset: int):
+            return executor.submit(self.search_cases, court=court, limit=page_size, offset=page_offset)
+
+        # One-deep pipeline: the next page downloads while the current one is processed
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = fetch_page(offset)
 
-            if not cases:
-                break
+            while next_page is not None:
+                cases = next_page.result()
 
-            # Process each case
-            for case in cases:
-                if len(documents) >= max_cases:
+                if not cases:
                     break
 
-                doc = self._process_case(case, court)
-                if doc:
-                    documents.append(doc)
+                offset += page_size
 
-            offset += page_size
-            time.sleep(1)  # Rate limiting
+                # Prefetch only if this page cannot fill the quota on its own
+                next_page = None
+                if len(documents) + len(cases) < max_cases:
+                    next_page = fetch_page(offset)
+
+                # Process each case
+                for case in cases:
+                    if len(documents) >= max_cases:
+                        break
+
+                    doc = self._process_case(case, court, court_name)
+                    if doc:
+                        documents.append(doc)
+
+                # Rejected cases left the quota unfilled after all
+                if next_page is None and len(documents) < max_cases:
+                    next_page = fetch_page(offset)
 
         logger.info(f"Crawled {len(documents)} cases from {court}")
         return documents
 
-    def _process_case(self, case_data: Dict[str, Any], court: str) -> Optional[Dict[str, Any]]:
+    def _process_case(
+        self, case_data: Dict[str, Any], court: str, court_name: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Process raw case data into standardized document format.
 
         Args:
             case_data: Raw case data from API
             court: Court abbreviation
+            court_name: Full court name (looked up from court if not given)
 
         Returns:
             Processed document dictionary
@@ -212,7 +250,7 @@ class OpenJurCrawler:
 
             # Create document
             doc = {
-                "doc_id": f"{court}-{case_id}".replace("/", "-").replace(" ", "-"),
+                "doc_id": f"{court}-{case_id}".translate(DOC_ID_TRANSLATION),
                 "title": title,
                 "text": text,
                 "url": url,
@@ -221,7 +259,7 @@ class OpenJurCrawler:
                 "court": court,
                 "case_id": case_id,
                 "date": date,
-                "court_name": self.courts.get(court, court),
+                "court_name": court_name or self.courts.get(court, court),
             }
 
             return doc
@@ -245,7 +283,6 @@ class OpenJurCrawler:
         for court in self.courts.keys():
             docs = self.crawl_court_cases(court, max_cases=max_cases_per_court)
             all_documents.extend(docs)
-            time.sleep(2)  # Rate limiting between courts
 
         logger.info(f"Total cases crawled: {len(all_documents)}")
         return all_documents
@@ -256,13 +293,11 @@ class OpenJurCrawler:
 
         Args:
             documents: List of case documents
-            filename: Output filename
+            filename: Output filename (".gz" suffix writes gzip-compressed JSONL)
         """
         output_path = self.output_dir / filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            for doc in documents:
-                f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+        write_jsonl(output_path, documents)
 
         logger.info(f"Saved {len(documents)} case documents to {output_path}")
 
@@ -271,7 +306,7 @@ class OpenJurCrawler:
         Load documents from JSONL file.
 
         Args:
-            filename: Input filename
+            filename: Input filename (".gz" suffix reads gzip-compressed JSONL)
 
         Returns:
             List of case documents
@@ -282,11 +317,7 @@ class OpenJurCrawler:
             logger.warning(f"File not found: {input_path}")
             return []
 
-        documents = []
-        with open(input_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    documents.append(json.loads(line))
+        documents = read_jsonl(input_path)
 
         logger.info(f"Loaded {len(documents)} case documents from {input_path}")
         return documents
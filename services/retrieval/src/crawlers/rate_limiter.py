@@ -0,0 +1,103 @@
+"""
+ABOUTME: Thread-safe token bucket rate limiter for crawler requests.
+ABOUTME: Bounds the long-term request rate while allowing short bursts; adapts to server feedback.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; each
+    request takes one. When the bucket is empty, acquire() sleeps just long
+    enough for the next token instead of a fixed delay. Safe to share
+    between threads: callers reserve their token under the lock and sleep
+    outside it, so waiters are served in order.
+
+    The rate adapts to server feedback (additive increase, multiplicative
+    decrease): on_success() raises it by `increase` up to max_rate,
+    on_failure() empties the bucket and multiplies it by `decrease` down to
+    min_rate. With the defaults (min_rate = max_rate = rate) it stays fixed.
+
+    Usage:
+        bucket = TokenBucket(capacity=5, rate=2.0, min_rate=0.2, max_rate=4.0)
+        bucket.acquire()
+        response = session.get(url)
+        bucket.on_success() if response.ok else bucket.on_failure()
+    """
+
+    def __init__(
+        self,
+        capacity: float = 5,
+        rate: float = 2.0,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+    ):
+        """
+        Initialize token bucket (starts full).
+
+        Args:
+            capacity: Maximum burst size
+            rate: Initial sustained requests per second
+            min_rate: Lowest rate after failures (default: rate)
+            max_rate: Highest rate after successes (default: rate)
+            increase: Requests/s added per success
+            decrease: Rate multiplier per failure
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.increase = increase
+        self.decrease = decrease
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add tokens for the time elapsed since the last refill (caller holds the lock)."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds slept
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def on_success(self):
+        """Server accepted a request: probe a slightly higher rate."""
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_failure(self):
+        """Server throttled or failed: drop banked tokens and halve the rate."""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, 0.0)
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+    def pause(self, seconds: float):
+        """Server asked to wait (e.g. Retry-After): hold off all requests for `seconds`."""
+        with self._lock:
+            self._refill()
+            # The next token becomes available `seconds` from now
+            self.tokens = min(self.tokens, 1 - seconds * self.rate)
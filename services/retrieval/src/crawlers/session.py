@@ -0,0 +1,57 @@
+"""
+ABOUTME: Shared HTTP session factory for the crawlers.
+ABOUTME: Pooled keep-alive connections with automatic retry/backoff on 429 and 5xx.
+"""
+
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session(
+    headers: Optional[Dict[str, str]] = None,
+    pool_size: int = 32,
+    retries: int = 5,
+    backoff_factor: float = 0.5,
+    raise_on_status: bool = True,
+) -> requests.Session:
+    """
+    Create a requests session with a sized connection pool and retries.
+
+    Retries use exponential backoff (backoff_factor * 2^n seconds) and
+    honor the server's Retry-After header on 429/503.
+
+    Args:
+        headers: Default headers for every request
+        pool_size: Connections kept per host (must cover concurrent requests)
+        retries: Maximum retries per request
+        backoff_factor: Base delay for exponential backoff
+        raise_on_status: Raise RetryError when retries run out on a retryable
+            status; if False, the last response is returned for the caller to handle
+
+    Returns:
+        Configured session
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            respect_retry_after_header=True,
+            raise_on_status=raise_on_status,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
@@ -6,11 +6,11 @@ ABOUTME: Handles batched encoding with GPU support and progress tracking.
 import os
 import logging
 from typing import List, Dict, Any, Optional
-import torch
-from sentence_transformers import SentenceTransformer
 from tqdm import tqdm
 from dotenv import load_dotenv
 
+from src.embedding.embedding_cache import EmbeddingCache
+
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO)
@@ -20,11 +20,19 @@ logger = logging.getLogger(__name__)
 class LegalTextEmbedder:
     """Embedder for legal text using multilingual-e5-large."""
 
+    DEFAULT_MODEL = "intfloat/multilingual-e5-large"
+
+    # Rough characters per token for German legal text with the XLM-R tokenizer;
+    # only used to size batches, so it needn't be exact
+    CHARS_PER_TOKEN = 4
+
     def __init__(
         self,
         model_name: Optional[str] = None,
         device: Optional[str] = None,
         batch_size: Optional[int] = None,
+        cache_path: Optional[str] = None,
+        quantization: Optional[str] = None,
     ):
         """
         Initialize embedder.
@@ -33,11 +41,28 @@ class LegalTextEmbedder:
             model_name: Embedding model name (defaults to env or multilingual-e5-large)
             device: Device to use (defaults to env or auto-detect)
             batch_size: Batch size for encoding (defaults to env or 32)
+            cache_path: SQLite embedding cache for encode_texts (defaults to env
+                EMBEDDING_CACHE_PATH; no persistent cache if unset)
+            quantization: "int8" for dynamic int8 quantization of the linear layers
+                on CPU, "none" to keep fp32 (defaults to env EMBEDDING_QUANTIZATION or "none")
         """
-        self.model_name = model_name or os.getenv(
-            "EMBEDDING_MODEL", "intfloat/multilingual-e5-large"
-        )
+        self.model_name = model_name or os.getenv("EMBEDDING_MODEL", self.DEFAULT_MODEL)
         self.batch_size = batch_size or int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+        self.quantization = (
+            quantization or os.getenv("EMBEDDING_QUANTIZATION", "none")
+        ).lower()
+        if self.quantization not in ("none", "int8"):
+            raise ValueError(f"Unknown embedding quantization: {self.quantization}")
+
+        # e5 models are trained with "query: " / "passage: " input prefixes
+        is_e5 = "e5" in self.model_name.lower()
+        self.query_prefix = "query: " if is_e5 else ""
+        self.passage_prefix = "passage: " if is_e5 else ""
+
+        # torch / sentence-transformers take seconds and hundreds of MB to import;
+        # load them only when a model is actually needed (not on fetch-only runs)
+        import torch
+        from sentence_transformers import SentenceTransformer
 
         # Determine device
         if device is None:
@@ -60,12 +85,85 @@ class LegalTextEmbedder:
             logger.error(f"Failed to load model: {e}")
             raise
 
+        if self.quantization == "int8":
+            self._quantize_int8()
+
+        # Quantized vectors differ slightly, so they are cached under their own key
+        cache_path = cache_path or os.getenv("EMBEDDING_CACHE_PATH")
+        cache_model = (
+            self.model_name if self.quantization == "none" else f"{self.model_name}:{self.quantization}"
+        )
+        self.cache = EmbeddingCache(cache_path, cache_model) if cache_path else None
+
+        # Padded tokens per encode_texts batch; the default matches batch_size
+        # full-length sequences, so short texts get proportionally larger batches
+        self.token_budget = int(
+            os.getenv("EMBEDDING_TOKEN_BUDGET", self.batch_size * self.model.max_seq_length)
+        )
+
+    def _quantize_int8(self):
+        """
+        Dynamically quantize the model's linear layers to int8 (CPU only).
+
+        Weights are stored as int8 and activations quantized on the fly, which
+        shrinks the model ~4x and runs the matmuls on int8 (VNNI) kernels.
+        """
+        if self.device != "cpu":
+            logger.warning(f"int8 quantization is CPU-only; keeping full precision on {self.device}")
+            self.quantization = "none"
+            return
+
+        import torch
+
+        torch.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+        logger.info("Quantized embedding model to int8 (dynamic, linear layers)")
+
+    def _token_batches(self, texts: List[str]) -> List[List[int]]:
+        """
+        Group texts into batches of similar token length within the token budget.
+
+        Texts are sorted by character length (as SentenceTransformer.encode
+        does internally) so each batch pads to a similar length; a batch grows
+        while (batch size x its longest estimated sequence) fits token_budget.
+        Estimating tokens from characters avoids tokenizing every text twice,
+        since model.encode tokenizes each batch anyway.
+
+        Args:
+            texts: List of text strings
+
+        Returns:
+            Batches of indices into texts
+        """
+        max_tokens = self.model.max_seq_length
+        lengths = [
+            min(max_tokens, -(-len(text) // self.CHARS_PER_TOKEN) + 2)  # + <s> and </s>
+            for text in texts
+        ]
+
+        batches: List[List[int]] = []
+        batch: List[int] = []
+        for i in sorted(range(len(texts)), key=lengths.__getitem__):
+            # Ascending order: the current text is the longest in the batch
+            if batch and (len(batch) + 1) * lengths[i] > self.token_budget:
+                batches.append(batch)
+                batch = []
+            batch.append(i)
+
+        if batch:
+            batches.append(batch)
+        return batches
+
     def encode_texts(
         self, texts: List[str], show_progress: bool = True
     ) -> List[List[float]]:
         """
         Encode texts into embeddings.
 
+        Duplicate texts are encoded once, and texts already in the embedding
+        cache (if configured) are not encoded at all.
+
         Args:
             texts: List of text strings
             show_progress: Show progress bar
@@ -76,20 +174,40 @@ class LegalTextEmbedder:
         if not texts:
             return []
 
-        logger.info(f"Encoding {len(texts)} texts (batch_size={self.batch_size})...")
+        # Repeated boilerplate (e.g. identical "eingangsformel" sections) is encoded once
+        unique_texts = list(dict.fromkeys(texts))
+        vectors = self.cache.get_many(unique_texts) if self.cache else {}
+        to_encode = [text for text in unique_texts if text not in vectors]
 
-        try:
-            # Encode with progress bar
-            embeddings = self.model.encode(
-                texts,
-                batch_size=self.batch_size,
-                show_progress_bar=show_progress,
-                convert_to_numpy=True,
-                normalize_embeddings=True,  # Normalize for cosine similarity
-            )
+        logger.info(
+            f"Encoding {len(to_encode)} texts (token_budget={self.token_budget}, "
+            f"{len(texts) - len(to_encode)} duplicate or cached)..."
+        )
 
-            # Convert to list of lists
-            embeddings_list = embeddings.tolist()
+        try:
+            if to_encode:
+                embeddings: List[Optional[List[float]]] = [None] * len(to_encode)
+                batches = self._token_batches(to_encode)
+
+                # Encode with progress bar (one step per length-bucketed batch)
+                for batch in tqdm(batches, desc="Encoding", disable=not show_progress):
+                    batch_embeddings = self.model.encode(
+                        [to_encode[i] for i in batch],
+                        batch_size=len(batch),
+                        show_progress_bar=False,
+                        convert_to_numpy=True,
+                        normalize_embeddings=True,  # Normalize for cosine similarity
+                    )
+                    for i, vector in zip(batch, batch_embeddings.tolist()):
+                        embeddings[i] = vector
+
+                encoded = dict(zip(to_encode, embeddings))
+                if self.cache:
+                    self.cache.put_many(encoded.items())
+                vectors.update(encoded)
+
+            # Back to input order (duplicates share one vector)
+            embeddings_list = [vectors[text] for text in texts]
 
             logger.info(f"Encoded {len(embeddings_list)} texts")
             return embeddings_list
@@ -108,17 +226,33 @@ class LegalTextEmbedder:
         Returns:
             Query embedding vector
         """
-        # For e5 models, prepend "query: " for better retrieval
-        if "e5" in self.model_name.lower():
-            query = f"query: {query}"
+        return self.encode_queries([query])[0]
+
+    def encode_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        Encode several query texts in one batched forward pass.
+
+        Args:
+            queries: Query strings
 
-        embedding = self.model.encode(
-            query,
+        Returns:
+            Query embedding vectors, in input order
+        """
+        if not queries:
+            return []
+
+        if self.query_prefix:
+            queries = [self.query_prefix + query for query in queries]
+
+        embeddings = self.model.encode(
+            queries,
+            batch_size=self.batch_size,
+            show_progress_bar=False,
             convert_to_numpy=True,
             normalize_embeddings=True,
         )
 
-        return embedding.tolist()
+        return embeddings.tolist()
 
     def encode_document(self, document: str) -> List[float]:
         """
@@ -130,17 +264,33 @@ class LegalTextEmbedder:
         Returns:
             Document embedding vector
         """
-        # For e5 models, prepend "passage: " for better retrieval
-        if "e5" in self.model_name.lower():
-            document = f"passage: {document}"
+        return self.encode_documents([document])[0]
+
+    def encode_documents(self, documents: List[str]) -> List[List[float]]:
+        """
+        Encode several document texts in one batched forward pass.
+
+        Args:
+            documents: Document strings
+
+        Returns:
+            Document embedding vectors, in input order
+        """
+        if not documents:
+            return []
 
-        embedding = self.model.encode(
-            document,
+        if self.passage_prefix:
+            documents = [self.passage_prefix + document for document in documents]
+
+        embeddings = self.model.encode(
+            documents,
+            batch_size=self.batch_size,
+            show_progress_bar=False,
             convert_to_numpy=True,
             normalize_embeddings=True,
         )
 
-        return embedding.tolist()
+        return embeddings.tolist()
 
     def encode_chunks(
         self, chunks: List[Dict[str, Any]], text_field: str = "text"
@@ -155,32 +305,21 @@ class LegalTextEmbedder:
         Returns:
             List of embedding vectors
         """
-        # Extract texts
-        texts = [chunk.get(text_field, "") for chunk in chunks]
-
-        # Filter empty texts
-        valid_indices = [i for i, text in enumerate(texts) if text.strip()]
-        valid_texts = [texts[i] for i in valid_indices]
-
-        if len(valid_texts) < len(texts):
+        # Extract non-empty texts (with the passage prefix) in one pass
+        prefix = self.passage_prefix
+        valid_texts = [
+            prefix + text
+            for text in (chunk.get(text_field, "") for chunk in chunks)
+            if text.strip()
+        ]
+
+        if len(valid_texts) < len(chunks):
             logger.warning(
-                f"Filtered out {len(texts) - len(valid_texts)} chunks with empty text"
+                f"Filtered out {len(chunks) - len(valid_texts)} chunks with empty text"
             )
 
-        # Prepend "passage: " for e5 models
-        if "e5" in self.model_name.lower():
-            valid_texts = [f"passage: {text}" for text in valid_texts]
-
-        # Encode
-        embeddings = self.encode_texts(valid_texts)
-
-        # Create full embeddings list with None for invalid indices
-        full_embeddings = [None] * len(texts)
-        for idx, emb_idx in enumerate(valid_indices):
-            full_embeddings[emb_idx] = embeddings[idx]
-
-        # Filter out None values and return
-        return [emb for emb in full_embeddings if emb is not None]
+        # Embeddings of the non-empty chunks, in chunk order
+        return self.encode_texts(valid_texts)
 
     def get_model_info(self) -> Dict[str, Any]:
         """
@@ -194,6 +333,8 @@ class LegalTextEmbedder:
             "embedding_dim": self.embedding_dim,
             "device": self.device,
             "batch_size": self.batch_size,
+            "token_budget": self.token_budget,
+            "quantization": self.quantization,
             "max_seq_length": self.model.max_seq_length,
         }
 
@@ -219,7 +360,7 @@ def main():
 
     # Encode documents
     print("=== Encoding Documents ===")
-    doc_embeddings = [embedder.encode_document(text) for text in test_texts]
+    doc_embeddings = embedder.encode_documents(test_texts)
     print(f"Encoded {len(doc_embeddings)} documents")
     print(f"Embedding shape: {len(doc_embeddings[0])} dimensions")
     print(f"Sample embedding (first 5 values): {doc_embeddings[0][:5]}")
@@ -0,0 +1,123 @@
+"""
+ABOUTME: Persistent embedding cache keyed by a content hash of the encoded text.
+ABOUTME: Lets re-runs of the ingestion pipelines skip re-embedding unchanged chunks.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# SQLite caps the number of bound parameters per statement
+LOOKUP_BATCH_SIZE = 500
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed store of embeddings keyed by blake2b(model name + text).
+
+    Vectors are stored as raw float32 bytes. The model name is part of the
+    key, so switching models never returns stale vectors.
+
+    Usage:
+        cache = EmbeddingCache("data/embeddings.sqlite", model_name)
+        found = cache.get_many(texts)
+        misses = [t for t in texts if t not in found]
+        cache.put_many(zip(misses, model.encode(misses)))
+    """
+
+    def __init__(self, path: str, model_name: str):
+        """
+        Initialize cache (creates the database file if missing).
+
+        Args:
+            path: SQLite database path
+            model_name: Embedding model the vectors belong to
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, text: str) -> str:
+        """Content hash of a text for the current model."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.model_name.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_many(self, texts: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Look up cached embeddings.
+
+        Args:
+            texts: Texts to look up (duplicates are fine)
+
+        Returns:
+            Mapping of text to embedding for every text found
+        """
+        keys = {self._key(text): text for text in texts}
+        found: Dict[str, List[float]] = {}
+
+        items = list(keys.items())
+        with self._lock:
+            for start in range(0, len(items), LOOKUP_BATCH_SIZE):
+                batch = [key for key, _ in items[start:start + LOOKUP_BATCH_SIZE]]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                )
+                for key, vector in rows:
+                    found[keys[key]] = np.frombuffer(vector, dtype=np.float32).tolist()
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, List[float]]]):
+        """
+        Store embeddings.
+
+        Args:
+            items: (text, embedding) pairs
+        """
+        rows = [
+            (self._key(text), np.asarray(vector, dtype=np.float32).tobytes())
+            for text, vector in items
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?)", rows)
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -4,17 +4,60 @@ ABOUTME: Splits documents into semantically coherent chunks for embedding and re
 """
 
 import os
+import re
 import logging
-import json
-from typing import List, Dict, Any, Generator, Optional
+import orjson
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Generator, Iterable, Iterator, Optional, Sized, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import blingfire
+    BLINGFIRE_AVAILABLE = True
+except ImportError:
+    BLINGFIRE_AVAILABLE = False
+
+try:
+    from semantic_text_splitter import TextSplitter
+    SEMANTIC_TEXT_SPLITTER_AVAILABLE = True
+except ImportError:
+    SEMANTIC_TEXT_SPLITTER_AVAILABLE = False
+
 load_dotenv()
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Legal document section markers at the start of a line: the preferred break
+# points, so a chunk starts with its § / Art. / Absatz heading
+SECTION_MARKER_PATTERN = re.compile(
+    r"^[ \t]*(?:"
+    r"§\s*\d+"  # § 823
+    r"|Art\.\s*\d+"  # Art. 1
+    r"|Absatz\s*\d+"  # Absatz 1
+    r"|Abs\.\s*\d+"  # Abs. 1
+    r"|\(\d+\)"  # (1)
+    r")",
+    re.MULTILINE,
+)
+
+# Paragraph breaks: a blank line, including whitespace-only lines and runs of them
+PARAGRAPH_SPLIT_PATTERN = re.compile(r"\n[ \t]*\n+")
+
+# Document fields copied into each of its chunks
+INHERITED_METADATA_KEYS = (
+    "doc_id",
+    "title",
+    "url",
+    "type",
+    "jurisdiction",
+    "law",
+    "court",
+    "section",
+    "date",
+    "case_id",
+)
+
 
 class TextChunker:
     """Chunks legal documents into optimal sizes for embedding."""
@@ -24,6 +67,7 @@ class TextChunker:
         chunk_size: int = None,
         chunk_overlap: int = None,
         output_dir: str = None,
+        backend: Optional[str] = None,
     ):
         """
         Initialize text chunker.
@@ -32,20 +76,45 @@ class TextChunker:
             chunk_size: Target chunk size in characters (defaults to env or 800)
             chunk_overlap: Overlap between chunks (defaults to env or 100)
             output_dir: Directory to save processed chunks
+            backend: "python" packs paragraphs (sliding window for long ones),
+                "sentences" packs blingfire sentence boundaries (needs blingfire),
+                "rust" uses the Rust semantic-text-splitter (needs semantic-text-splitter)
+                (defaults to env CHUNK_BACKEND or "python")
         """
         self.chunk_size = chunk_size or int(os.getenv("CHUNK_SIZE", "800"))
         self.chunk_overlap = chunk_overlap or int(os.getenv("CHUNK_OVERLAP", "100"))
+        self.backend = (backend or os.getenv("CHUNK_BACKEND", "python")).lower()
+        if self.backend not in ("python", "sentences", "rust"):
+            raise ValueError(f"Unknown chunking backend: {self.backend}")
+        if self.backend == "sentences" and not BLINGFIRE_AVAILABLE:
+            logger.warning("blingfire not installed; falling back to the python chunking backend")
+            self.backend = "python"
+        if self.backend == "rust" and not SEMANTIC_TEXT_SPLITTER_AVAILABLE:
+            logger.warning(
+                "semantic-text-splitter not installed; falling back to the python chunking backend"
+            )
+            self.backend = "python"
+        self._rust_splitter = None  # Built on first use (not picklable for worker processes)
         self.output_dir = Path(output_dir or "data/processed")
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Legal document section markers
-        self.section_markers = [
-            r"§\s*\d+",  # § 823
-            r"Art\.\s*\d+",  # Art. 1
-            r"Absatz\s*\d+",  # Absatz 1
-            r"Abs\.\s*\d+",  # Abs. 1
-            r"\(\d+\)",  # (1)
-        ]
+        # Sentence endings are searched in the last 20% of a window
+        self._break_window = int(self.chunk_size * 0.2)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the Rust splitter; worker processes build their own."""
+        state = self.__dict__.copy()
+        state["_rust_splitter"] = None
+        return state
+
+    def _get_rust_splitter(self) -> "TextSplitter":
+        """Rust splitter filling chunks to between chunk_size - overlap and chunk_size."""
+        if self._rust_splitter is None:
+            overlap = self.chunk_overlap if self.chunk_overlap > 0 else 0
+            self._rust_splitter = TextSplitter(
+                (self.chunk_size - overlap, self.chunk_size), overlap=overlap
+            )
+        return self._rust_splitter
 
     def chunk_text(self, text: str, preserve_paragraphs: bool = True) -> List[str]:
         """
@@ -67,9 +136,15 @@ class TextChunker:
 
         chunks = []
 
-        if preserve_paragraphs:
+        if preserve_paragraphs and self.backend == "rust":
+            # Largest semantic units (paragraphs, sentences, words) that fit, in Rust
+            chunks = self._get_rust_splitter().chunks(text)
+        elif preserve_paragraphs and self.backend == "sentences":
+            # Pack whole sentences (blingfire boundaries handle "Abs.", "Nr." etc.)
+            chunks = self._chunk_sentences(text)
+        elif preserve_paragraphs:
             # Split by paragraphs first
-            paragraphs = text.split("\n\n")
+            paragraphs = PARAGRAPH_SPLIT_PATTERN.split(text)
             chunks = self._chunk_paragraphs(paragraphs)
         else:
             # Simple sliding window
@@ -136,6 +211,56 @@ class TextChunker:
 
         return chunks
 
+    def _chunk_sentences(self, text: str) -> List[str]:
+        """
+        Chunk text by packing whole sentences (blingfire sentence boundaries).
+
+        Chunks are slices of text, so paragraph breaks inside a chunk are kept.
+        The overlap is made of the trailing sentences of the previous chunk that
+        fit in chunk_overlap; sentences longer than chunk_size fall back to the
+        sliding window.
+
+        Args:
+            text: Text to chunk
+
+        Returns:
+            List of chunks
+        """
+        _, sentences = blingfire.text_to_sentences_and_offsets(text)
+
+        chunk_size = self.chunk_size
+        overlap = self.chunk_overlap if self.chunk_overlap > 0 else 0
+
+        chunks = []
+        window: List[Tuple[int, int]] = []  # Sentence spans of the current chunk
+
+        for start, end in sentences:
+            # Sentence alone exceeds chunk size: flush and split it
+            if end - start > chunk_size:
+                if window:
+                    chunks.append(text[window[0][0]:window[-1][1]])
+                    window = []
+                chunks.extend(self._sliding_window_chunk(text[start:end]))
+                continue
+
+            if window and end - window[0][0] > chunk_size:
+                chunks.append(text[window[0][0]:window[-1][1]])
+
+                # Carry over the trailing sentences that fit in the overlap
+                keep = len(window)
+                while keep > 0 and window[-1][1] - window[keep - 1][0] <= overlap:
+                    keep -= 1
+                window = window[keep:]
+                while window and end - window[0][0] > chunk_size:
+                    window.pop(0)
+
+            window.append((start, end))
+
+        if window:
+            chunks.append(text[window[0][0]:window[-1][1]])
+
+        return chunks
+
     def _sliding_window_chunk(self, text: str) -> List[str]:
         """
         Simple sliding window chunking with overlap.
@@ -150,13 +275,19 @@ class TextChunker:
         start = 0
         text_len = len(text)
 
+        # Locals: the loop runs once per window of long documents
+        chunk_size = self.chunk_size
+        overlap = self.chunk_overlap if self.chunk_overlap > 0 else 0
+        find_break_point = self._find_break_point
+        section_at = SECTION_MARKER_PATTERN.match
+
         while start < text_len:
-            end = start + self.chunk_size
+            end = start + chunk_size
 
             # Try to break at sentence or word boundary
             if end < text_len:
                 # Look for sentence end
-                break_point = self._find_break_point(text, start, end)
+                break_point = find_break_point(text, start, end)
                 if break_point > start:
                     end = break_point
 
@@ -164,8 +295,14 @@ class TextChunker:
             if chunk:
                 chunks.append(chunk)
 
-            # Move start with overlap
-            start = end - self.chunk_overlap if self.chunk_overlap > 0 else end
+            # Move start with overlap (without overlap if the break point landed
+            # within the overlap of the window start, which would never advance,
+            # or on a section heading, so the next chunk starts with the heading
+            # instead of the tail of the previous section)
+            if end - overlap > start and not (end < text_len and section_at(text, end)):
+                start = end - overlap
+            else:
+                start = end
 
         return chunks
 
@@ -181,59 +318,69 @@ class TextChunker:
         Returns:
             Optimal break position
         """
-        # Look for sentence ending within last 20% of chunk
-        search_start = end - int(self.chunk_size * 0.2)
-        search_region = text[search_start:end]
+        # Look for a break within last 20% of chunk (bounded searches,
+        # no substring copies of the text)
+        search_start = end - self._break_window
+
+        # Section markers first (the last one in the window, for the longest chunk)
+        section_start = -1
+        for match in SECTION_MARKER_PATTERN.finditer(text, search_start, end):
+            section_start = match.start()
+        if section_start > start:
+            return section_start
 
         # Sentence endings
-        for delimiter in [".\n", ". ", ".\n\n", "!", "?"]:
-            pos = search_region.rfind(delimiter)
+        for delimiter in (".\n", ". ", ".\n\n", "!", "?"):
+            pos = text.rfind(delimiter, search_start, end)
             if pos != -1:
-                return search_start + pos + len(delimiter)
+                return pos + len(delimiter)
 
         # Fall back to word boundary
-        last_space = text[:end].rfind(" ")
+        last_space = text.rfind(" ", start, end)
         if last_space > start:
             return last_space + 1
 
         # No good break point found
         return end
 
-    def chunk_document(self, doc: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def iter_chunk_document(self, doc: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """
-        Chunk a document and create chunk dictionaries.
+        Chunk a document, yielding one chunk dictionary at a time.
 
         Args:
             doc: Document dictionary with 'text' field
 
-        Returns:
-            List of chunk dictionaries with metadata
+        Yields:
+            Chunk dictionaries with metadata, in document order
         """
         text = doc.get("text", "")
         chunks_text = self.chunk_text(text)
 
-        chunk_docs = []
+        # Metadata inherited from the parent document, looked up once per document
+        inherited = {key: doc.get(key) for key in INHERITED_METADATA_KEYS}
+        doc_id = doc.get("doc_id", "unknown")
+        total_chunks = len(chunks_text)
+
         for idx, chunk_text in enumerate(chunks_text):
-            chunk_doc = {
-                "chunk_id": f"{doc.get('doc_id', 'unknown')}_chunk_{idx}",
+            yield {
+                "chunk_id": f"{doc_id}_chunk_{idx}",
                 "text": chunk_text,
                 "chunk_index": idx,
-                "total_chunks": len(chunks_text),
-                # Inherit metadata from parent document
-                "doc_id": doc.get("doc_id"),
-                "title": doc.get("title"),
-                "url": doc.get("url"),
-                "type": doc.get("type"),
-                "jurisdiction": doc.get("jurisdiction"),
-                "law": doc.get("law"),
-                "court": doc.get("court"),
-                "section": doc.get("section"),
-                "date": doc.get("date"),
-                "case_id": doc.get("case_id"),
+                "total_chunks": total_chunks,
+                **inherited,
             }
-            chunk_docs.append(chunk_doc)
 
-        return chunk_docs
+    def chunk_document(self, doc: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Chunk a document and create chunk dictionaries.
+
+        Args:
+            doc: Document dictionary with 'text' field
+
+        Returns:
+            List of chunk dictionaries with metadata
+        """
+        return list(self.iter_chunk_document(doc))
 
     def chunk_documents(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -251,27 +398,30 @@ class TextChunker:
         """
         if len(documents) > 5000:
             logger.warning(
-                f"Processing {len(documents)} documents at once may cause memory issues. "
-                "Consider using chunk_documents_batched() instead."
+                "Processing %d documents at once may cause memory issues. "
+                "Consider using chunk_documents_batched() instead.",
+                len(documents),
             )
 
-        logger.info(f"Chunking {len(documents)} documents (chunk_size={self.chunk_size})...")
+        logger.info("Chunking %d documents (chunk_size=%d)...", len(documents), self.chunk_size)
 
         all_chunks = []
         for doc in documents:
             chunks = self.chunk_document(doc)
             all_chunks.extend(chunks)
 
-        logger.info(f"Created {len(all_chunks)} chunks from {len(documents)} documents")
+        logger.info("Created %d chunks from %d documents", len(all_chunks), len(documents))
         if len(documents) > 0:
-            logger.info(f"Average chunks per document: {len(all_chunks) / len(documents):.1f}")
+            logger.info("Average chunks per document: %.1f", len(all_chunks) / len(documents))
 
         return all_chunks
 
     def chunk_documents_batched(
         self,
-        documents: List[Dict[str, Any]],
+        documents: Iterable[Dict[str, Any]],
         batch_size: int = 1000,
+        workers: Optional[int] = None,
+        target_chars_per_batch: Optional[int] = None,
     ) -> Generator[List[Dict[str, Any]], None, None]:
         """
         Chunk documents in batches to avoid memory issues.
@@ -281,14 +431,22 @@ class TextChunker:
         accumulating everything in memory.
 
         Benefits:
-        - Memory efficient: O(batch_size) instead of O(total_documents)
+        - Memory efficient: O(batch_size) instead of O(total_documents); documents
+          may be a lazy iterator (e.g. a JSONL reader) so the corpus is never
+          materialized
+        - Balanced: A batch also ends once its documents reach target_chars_per_batch
+          characters, so batches of long judgments stay as large as batches of snippets
         - Progress tracking: Logs after each batch
         - Fault tolerant: Can checkpoint after each batch
         - Scalable: Works with millions of documents
+        - Parallel: Documents of a batch are chunked across worker processes
 
         Args:
-            documents: Full list of document dictionaries
-            batch_size: Number of documents to process per batch
+            documents: Document dictionaries (list or any iterable)
+            batch_size: Maximum number of documents per batch
+            workers: Chunking processes (defaults to env CHUNK_WORKERS or 1 = in-process)
+            target_chars_per_batch: Text characters after which a batch ends early
+                (defaults to env CHUNK_BATCH_CHARS or 10,000,000)
 
         Yields:
             Batches of chunk dictionaries
@@ -299,44 +457,148 @@ class TextChunker:
             ...     # Process batch (e.g., save, embed, etc.)
             ...     save_chunks(chunk_batch)
         """
-        total_docs = len(documents)
-        total_batches = (total_docs + batch_size - 1) // batch_size  # Ceiling division
+        for batch_chunks in self._iter_batches(
+            documents, batch_size, workers, target_chars_per_batch
+        ):
+            yield list(batch_chunks)
+
+    def iter_chunk_documents_batched(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        batch_size: int = 1000,
+        workers: Optional[int] = None,
+        target_chars_per_batch: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Chunk documents in batches, yielding one chunk dictionary at a time.
+
+        Same batching, workers and progress logging as chunk_documents_batched(),
+        but in-process no batch of chunks is ever materialized, so chunks can be
+        streamed straight into embedding or serialization.
+
+        Args:
+            documents: Document dictionaries (list or any iterable)
+            batch_size: Maximum number of documents per batch
+            workers: Chunking processes (defaults to env CHUNK_WORKERS or 1 = in-process)
+            target_chars_per_batch: Text characters after which a batch ends early
+                (defaults to env CHUNK_BATCH_CHARS or 10,000,000)
+
+        Yields:
+            Chunk dictionaries, in document order
+        """
+        for batch_chunks in self._iter_batches(
+            documents, batch_size, workers, target_chars_per_batch
+        ):
+            yield from batch_chunks
+
+    def _iter_batches(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        batch_size: int,
+        workers: Optional[int],
+        target_chars_per_batch: Optional[int],
+    ) -> Iterator[Iterator[Dict[str, Any]]]:
+        """
+        Split documents into batches and yield a lazy chunk iterator per batch.
+
+        A batch ends at batch_size documents or once its documents hold
+        target_chars_per_batch characters of text, whichever comes first.
+
+        Each batch iterator must be exhausted before the next one is requested;
+        it logs the batch's progress once exhausted.
+
+        Args:
+            documents: Document dictionaries (list or any iterable)
+            batch_size: Maximum number of documents per batch
+            workers: Chunking processes (defaults to env CHUNK_WORKERS or 1 = in-process)
+            target_chars_per_batch: Text characters after which a batch ends early
+                (defaults to env CHUNK_BATCH_CHARS or 10,000,000)
+
+        Yields:
+            One iterator of chunk dictionaries per batch
+        """
+        target_chars_per_batch = target_chars_per_batch or int(
+            os.getenv("CHUNK_BATCH_CHARS", "10000000")
+        )
 
+        # The document total is only known up front for sized inputs (lists), not
+        # iterators; the batch count depends on document lengths either way
+        total_docs = len(documents) if isinstance(documents, Sized) else None
         logger.info(
-            f"Chunking {total_docs} documents in {total_batches} batches "
-            f"(batch_size={batch_size}, chunk_size={self.chunk_size})"
+            "Chunking %s documents (batch_size=%d, target_chars_per_batch=%d, chunk_size=%d)",
+            total_docs if total_docs is not None else "streamed",
+            batch_size, target_chars_per_batch, self.chunk_size,
         )
 
         total_chunks_created = 0
 
-        for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min(start_idx + batch_size, total_docs)
-            batch_docs = documents[start_idx:end_idx]
+        # chunk_document is a pure function of the document, so a batch splits
+        # across processes; the pool is reused for all batches
+        workers = workers or int(os.getenv("CHUNK_WORKERS", "1"))
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+        def batch_chunks(
+            batch_docs: List[Dict[str, Any]], batch_num: int, start_idx: int
+        ) -> Iterator[Dict[str, Any]]:
+            nonlocal total_chunks_created
+
+            # Chunk this batch (in document order); in-process, chunks are
+            # generated one at a time instead of per-document lists
+            if executor:
+                doc_chunks = executor.map(
+                    self.chunk_document,
+                    batch_docs,
+                    chunksize=max(1, len(batch_docs) // (workers * 4)),
+                )
+            else:
+                doc_chunks = map(self.iter_chunk_document, batch_docs)
 
-            # Chunk this batch
-            batch_chunks = []
-            for doc in batch_docs:
-                chunks = self.chunk_document(doc)
-                batch_chunks.extend(chunks)
+            batch_count = 0
+            for chunks in doc_chunks:
+                for chunk in chunks:
+                    batch_count += 1
+                    yield chunk
 
-            total_chunks_created += len(batch_chunks)
+            total_chunks_created += batch_count
 
             # Log progress
             logger.info(
-                f"Batch {batch_num + 1}/{total_batches}: "
-                f"Processed docs {start_idx + 1}-{end_idx}/{total_docs}, "
-                f"created {len(batch_chunks)} chunks "
-                f"(total: {total_chunks_created} chunks)"
+                "Batch %d: Processed docs %d-%d/%s, created %d chunks (total: %d chunks)",
+                batch_num, start_idx + 1, start_idx + len(batch_docs),
+                total_docs or "?", batch_count, total_chunks_created,
             )
 
-            yield batch_chunks
+        doc_iter = iter(documents)
+        batch_num = 0
+        end_idx = 0
+
+        try:
+            while True:
+                # Fill the batch up to the document cap or the character budget
+                batch_docs = []
+                batch_chars = 0
+                for doc in doc_iter:
+                    batch_docs.append(doc)
+                    batch_chars += len(doc.get("text") or "")
+                    if len(batch_docs) >= batch_size or batch_chars >= target_chars_per_batch:
+                        break
+
+                if not batch_docs:
+                    break
+
+                batch_num += 1
+                start_idx = end_idx
+                end_idx = start_idx + len(batch_docs)
+
+                yield batch_chunks(batch_docs, batch_num, start_idx)
+        finally:
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
 
         # Final summary
         logger.info(
-            f"Chunking complete: {total_docs} documents → "
-            f"{total_chunks_created} chunks "
-            f"(avg: {total_chunks_created / total_docs:.1f} chunks/doc)"
+            "Chunking complete: %d documents → %d chunks (avg: %.1f chunks/doc)",
+            end_idx, total_chunks_created, total_chunks_created / max(end_idx, 1),
         )
 
     def save_chunks(self, chunks: List[Dict[str, Any]], filename: str = "chunks.jsonl"):
@@ -349,35 +611,50 @@ class TextChunker:
         """
         output_path = self.output_dir / filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            for chunk in chunks:
-                f.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+        # orjson writes UTF-8 bytes directly; a 1 MB buffer batches the writes
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            f.writelines(orjson.dumps(chunk, option=orjson.OPT_APPEND_NEWLINE) for chunk in chunks)
 
-        logger.info(f"Saved {len(chunks)} chunks to {output_path}")
+        logger.info("Saved %d chunks to %s", len(chunks), output_path)
 
-    def load_chunks(self, filename: str = "chunks.jsonl") -> List[Dict[str, Any]]:
+    def iter_chunks(self, filename: str = "chunks.jsonl") -> Iterator[Dict[str, Any]]:
         """
-        Load chunks from JSONL file.
+        Stream chunks from a JSONL file one at a time.
+
+        Only one line is held in memory, so million-chunk files can be fed
+        straight into embedding or upload batches.
 
         Args:
             filename: Input filename
 
-        Returns:
-            List of chunk dictionaries
+        Yields:
+            Chunk dictionaries, in file order
         """
         input_path = self.output_dir / filename
 
         if not input_path.exists():
-            logger.warning(f"File not found: {input_path}")
-            return []
+            logger.warning("File not found: %s", input_path)
+            return
 
-        chunks = []
-        with open(input_path, "r", encoding="utf-8") as f:
+        with open(input_path, "rb") as f:
             for line in f:
-                if line.strip():
-                    chunks.append(json.loads(line))
+                if not line.isspace():
+                    yield orjson.loads(line)
+
+    def load_chunks(self, filename: str = "chunks.jsonl") -> List[Dict[str, Any]]:
+        """
+        Load chunks from JSONL file.
+
+        Args:
+            filename: Input filename
+
+        Returns:
+            List of chunk dictionaries (see iter_chunks() to stream instead)
+        """
+        chunks = list(self.iter_chunks(filename))
 
-        logger.info(f"Loaded {len(chunks)} chunks from {input_path}")
+        if chunks:
+            logger.info("Loaded %d chunks from %s", len(chunks), self.output_dir / filename)
         return chunks
 
 
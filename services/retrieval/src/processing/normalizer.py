@@ -4,46 +4,60 @@ ABOUTME: Cleans HTML artifacts, normalizes whitespace, and prepares text for emb
 """
 
 import re
+import html
 import logging
+from re import Match
 from typing import List, Dict, Any
 import unicodedata
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Standardize common legal abbreviations (compiled once, see clean_legal_references)
+LEGAL_REFERENCE_PATTERNS = tuple(
+    (re.compile(pattern), replacement)
+    for pattern, replacement in (
+        (r"\bBGB\b", "BGB"),
+        (r"\bStGB\b", "StGB"),
+        (r"\bGG\b", "GG"),
+        (r"\bZPO\b", "ZPO"),
+        (r"\bStPO\b", "StPO"),
+    )
+)
+
 
 class TextNormalizer:
     """Normalizes legal text for processing and embedding."""
 
     def __init__(self):
         """Initialize normalizer with cleaning patterns."""
-        # HTML entities and artifacts
-        self.html_patterns = [
-            (r"&nbsp;", " "),
-            (r"&amp;", "&"),
-            (r"&lt;", "<"),
-            (r"&gt;", ">"),
-            (r"&quot;", '"'),
-            (r"&apos;", "'"),
-            (r"<[^>]+>", ""),  # Remove HTML tags
-        ]
-
-        # Whitespace patterns
-        self.whitespace_patterns = [
-            (r"\r\n", "\n"),  # Normalize line endings
-            (r"\r", "\n"),
-            (r"\t", " "),  # Convert tabs to spaces
-            (r" +", " "),  # Collapse multiple spaces
-            (r"\n{3,}", "\n\n"),  # Max 2 consecutive newlines
-        ]
-
-        # Legal document specific patterns
-        self.legal_patterns = [
-            (r"\((\d+)\)", r"(\1)"),  # Normalize parentheses around numbers
-            (r"§\s+(\d+)", r"§\1"),  # Normalize § spacing
-            (r"Abs\.\s+(\d+)", r"Abs. \1"),  # Normalize Absatz
-            (r"Nr\.\s+(\d+)", r"Nr. \1"),  # Normalize Nummer
-        ]
+        # HTML tags (entities are decoded by html.unescape afterwards)
+        self.tag_pattern = re.compile(r"<[^>]+>")
+
+        # Whitespace and legal reference spacing, fixed in a second scan. Only
+        # text that changes is matched (single spaces and newlines are not)
+        self.layout_pattern = re.compile(
+            r"(?=[\r\n\t \xa0§AN])(?:"  # Lets the scanner skip to candidate characters
+            r"(?P<paragraph_break>(?:\r\n?|\n){3,})"  # Max 2 consecutive newlines
+            r"|(?P<line_ending>\r\n?)"  # Normalize line endings
+            r"|(?P<spaces>[ \t\xa0]{2,}|[\t\xa0])"  # Tabs / no-break spaces to spaces, collapse
+            r"|§\s+(?P<section>\d+)"  # Normalize § spacing
+            r"|(?P<abbreviation>Abs\.|Nr\.)\s+(?P<number>\d+)"  # Normalize Absatz / Nummer
+            r")"
+        )
+
+    @staticmethod
+    def _replace_layout(match: Match[str]) -> str:
+        """Replacement for a layout_pattern match, by the alternative that matched."""
+        kind = match.lastgroup
+        if kind == "paragraph_break":
+            return "\n\n"
+        if kind == "line_ending":
+            return "\n"
+        if kind == "spaces":
+            return " "
+        if kind == "section":
+            return f"§{match.group('section')}"
+        return f"{match.group('abbreviation')} {match.group('number')}"
 
     def normalize(self, text: str) -> str:
         """
@@ -58,38 +72,22 @@ class TextNormalizer:
         if not text:
             return ""
 
-        # 1. Unicode normalization (NFC form)
-        text = unicodedata.normalize("NFC", text)
+        # 1. Remove HTML tags, then decode entities (all named and numeric ones;
+        # tags first, so decoded "&lt;" / "&gt;" stay text)
+        text = self.tag_pattern.sub("", text)
+        text = html.unescape(text)
 
-        # 2. Remove HTML entities and tags
-        text = self._apply_patterns(text, self.html_patterns)
-
-        # 3. Normalize whitespace
-        text = self._apply_patterns(text, self.whitespace_patterns)
+        # 2. Unicode normalization (NFC form, also covering decoded entities)
+        text = unicodedata.normalize("NFC", text)
 
-        # 4. Legal document specific normalization
-        text = self._apply_patterns(text, self.legal_patterns)
+        # 3. Normalize whitespace and legal document specific spacing
+        text = self.layout_pattern.sub(self._replace_layout, text)
 
-        # 5. Strip leading/trailing whitespace
+        # 4. Strip leading/trailing whitespace
         text = text.strip()
 
         return text
 
-    def _apply_patterns(self, text: str, patterns: List[tuple[str, str]]) -> str:
-        """
-        Apply regex replacement patterns.
-
-        Args:
-            text: Text to process
-            patterns: List of (pattern, replacement) tuples
-
-        Returns:
-            Processed text
-        """
-        for pattern, replacement in patterns:
-            text = re.sub(pattern, replacement, text)
-        return text
-
     def normalize_document(self, doc: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize text fields in a document dictionary.
@@ -122,7 +120,7 @@ class TextNormalizer:
         Returns:
             List of normalized documents
         """
-        logger.info(f"Normalizing {len(documents)} documents...")
+        logger.info("Normalizing %d documents...", len(documents))
 
         normalized_docs = []
         for doc in documents:
@@ -130,12 +128,12 @@ class TextNormalizer:
 
             # Skip documents with insufficient text
             if len(normalized_doc.get("text", "")) < 20:
-                logger.warning(f"Skipping document {doc.get('doc_id')} - insufficient text")
+                logger.warning("Skipping document %s - insufficient text", doc.get("doc_id"))
                 continue
 
             normalized_docs.append(normalized_doc)
 
-        logger.info(f"Normalized {len(normalized_docs)} documents")
+        logger.info("Normalized %d documents", len(normalized_docs))
         return normalized_docs
 
     @staticmethod
@@ -149,17 +147,8 @@ class TextNormalizer:
         Returns:
             Text with standardized references
         """
-        # Standardize common legal abbreviations
-        replacements = {
-            r"\bBGB\b": "BGB",
-            r"\bStGB\b": "StGB",
-            r"\bGG\b": "GG",
-            r"\bZPO\b": "ZPO",
-            r"\bStPO\b": "StPO",
-        }
-
-        for pattern, replacement in replacements.items():
-            text = re.sub(pattern, replacement, text)
+        for pattern, replacement in LEGAL_REFERENCE_PATTERNS:
+            text = pattern.sub(replacement, text)
 
         return text
 
@@ -6,8 +6,9 @@ ABOUTME: Handles collection creation, upserting chunks, and similarity search.
 import os
 import logging
 import hashlib
-from typing import List, Dict, Any, Optional
-from qdrant_client import QdrantClient
+import numpy as np
+from typing import List, Dict, Any, Optional, Sequence, Union
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
     Distance,
     VectorParams,
@@ -15,6 +16,15 @@ from qdrant_client.models import (
     Filter,
     FieldCondition,
     MatchValue,
+    MatchAny,
+    QueryRequest,
+    SearchParams,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
 )
 from dotenv import load_dotenv
 
@@ -26,6 +36,16 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Quantized search: score candidates on compressed vectors, then rescore the
+# top (limit * oversampling) against the original float32 vectors
+QUANTIZED_SEARCH_PARAMS = SearchParams(
+    quantization=QuantizationSearchParams(
+        rescore=True,
+        oversampling=float(os.getenv("QDRANT_OVERSAMPLING", "2.0")),
+    )
+)
+
+
 class JuraGPTQdrantClient:
     """Qdrant client for JuraGPT legal corpus."""
 
@@ -34,6 +54,7 @@ class JuraGPTQdrantClient:
         url: Optional[str] = None,
         api_key: Optional[str] = None,
         collection_name: Optional[str] = None,
+        pool_size: Optional[int] = None,
     ):
         """
         Initialize Qdrant client.
@@ -42,12 +63,16 @@ class JuraGPTQdrantClient:
             url: Qdrant server URL (defaults to env QDRANT_URL)
             api_key: Qdrant API key (defaults to env QDRANT_API_KEY)
             collection_name: Collection name (defaults to env QDRANT_COLLECTION)
+            pool_size: Connection pool size (defaults to env QDRANT_POOL_SIZE or 100).
+                Must be >= the number of concurrent in-flight requests, otherwise
+                requests queue for a free connection.
         """
         self.url = url or os.getenv("QDRANT_URL")
         self.api_key = api_key or os.getenv("QDRANT_API_KEY")
         self.collection_name = collection_name or os.getenv(
             "QDRANT_COLLECTION", "juragpt_public_law"
         )
+        self.pool_size = pool_size or int(os.getenv("QDRANT_POOL_SIZE", "100"))
 
         if not self.url or not self.api_key:
             raise ValueError(
@@ -60,15 +85,22 @@ class JuraGPTQdrantClient:
             api_key=self.api_key,
             prefer_grpc=True,  # Use gRPC for bulk uploads (fallback to REST if unavailable)
             timeout=300,  # 5 minute timeout for large batches
+            pool_size=self.pool_size,  # Applies to both the REST and gRPC pools
             grpc_options={
                 'grpc.max_send_message_length': 100 * 1024 * 1024,  # 100MB
                 'grpc.max_receive_message_length': 100 * 1024 * 1024,
             }
         )
-        logger.info(f"Connected to Qdrant at {self.url} (prefer_grpc=True)")
+        logger.info(
+            f"Connected to Qdrant at {self.url} (prefer_grpc=True, pool_size={self.pool_size})"
+        )
 
     def create_collection(
-        self, vector_size: int = 1024, distance: Distance = Distance.COSINE, force: bool = False
+        self,
+        vector_size: int = 1024,
+        distance: Distance = Distance.COSINE,
+        force: bool = False,
+        quantization: Optional[str] = None,
     ):
         """
         Create Qdrant collection with specified parameters.
@@ -77,6 +109,7 @@ class JuraGPTQdrantClient:
             vector_size: Dimension of embedding vectors (default: 1024 for multilingual-e5-large)
             distance: Distance metric (default: COSINE)
             force: If True, recreate collection if it exists
+            quantization: "int8", "binary" or "none" (defaults to env QDRANT_QUANTIZATION or "int8")
         """
         try:
             # Check if collection exists
@@ -95,9 +128,11 @@ class JuraGPTQdrantClient:
             self.client.create_collection(
                 collection_name=self.collection_name,
                 vectors_config=VectorParams(size=vector_size, distance=distance),
+                quantization_config=self._quantization_config(quantization),
             )
             logger.info(
-                f"Created collection {self.collection_name} with vector_size={vector_size}, distance={distance}"
+                f"Created collection {self.collection_name} with vector_size={vector_size}, "
+                f"distance={distance}, quantization={quantization or os.getenv('QDRANT_QUANTIZATION', 'int8')}"
             )
 
             # Create payload indexes for filtering
@@ -107,9 +142,50 @@ class JuraGPTQdrantClient:
             logger.error(f"Error creating collection: {e}")
             raise
 
+    @staticmethod
+    def _quantization_config(
+        quantization: Optional[str] = None,
+    ) -> Optional[Union[ScalarQuantization, BinaryQuantization]]:
+        """
+        Build the quantization config for a collection.
+
+        int8 keeps a 4x smaller copy of every vector in RAM; binary keeps a
+        32x smaller one but loses more recall before rescoring. The original
+        float32 vectors stay on disk for rescoring either way.
+        """
+        quantization = (quantization or os.getenv("QDRANT_QUANTIZATION", "int8")).lower()
+
+        if quantization == "int8":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+            )
+        if quantization == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        if quantization == "none":
+            return None
+
+        raise ValueError(f"Unknown quantization: {quantization} (expected int8, binary or none)")
+
+    def enable_quantization(self, quantization: Optional[str] = None):
+        """
+        Add quantization to an existing collection (Qdrant rebuilds it in the background).
+
+        Args:
+            quantization: "int8", "binary" or "none" (defaults to env QDRANT_QUANTIZATION or "int8")
+        """
+        config = self._quantization_config(quantization)
+        if config is None:
+            return
+
+        self.client.update_collection(
+            collection_name=self.collection_name,
+            quantization_config=config,
+        )
+        logger.info(f"Enabled {type(config).__name__} on collection {self.collection_name}")
+
     def _create_payload_indexes(self):
         """Create indexes on payload fields for efficient filtering."""
-        index_fields = ["type", "law", "court", "jurisdiction", "date"]
+        index_fields = ["type", "law", "court", "jurisdiction", "date", "doc_id"]
 
         for field in index_fields:
             try:
@@ -122,15 +198,46 @@ class JuraGPTQdrantClient:
             except Exception as e:
                 logger.warning(f"Could not create index on {field}: {e}")
 
+    def ensure_payload_indexes(self, fields: Sequence[str] = ("type", "law", "doc_id")) -> List[str]:
+        """
+        Create keyword payload indexes for fields that are not indexed yet.
+
+        Args:
+            fields: Payload fields that must be indexed
+
+        Returns:
+            Names of the fields whose index was created
+        """
+        payload_schema = self.client.get_collection(self.collection_name).payload_schema or {}
+
+        created = []
+        for field in fields:
+            if field in payload_schema:
+                continue
+
+            self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field,
+                field_schema="keyword",
+            )
+            logger.info(f"Created missing payload index on field: {field}")
+            created.append(field)
+
+        return created
+
     def upsert_chunks(
-        self, chunks: List[Dict[str, Any]], vectors: List[List[float]], batch_size: int = 100
+        self,
+        chunks: List[Dict[str, Any]],
+        vectors: Union[List[List[float]], np.ndarray],
+        batch_size: int = 100,
     ):
         """
         Upsert document chunks with embeddings to Qdrant.
 
         Args:
             chunks: List of chunk dictionaries with metadata
-            vectors: Corresponding embedding vectors
+            vectors: Corresponding embedding vectors (lists or a 2D array, e.g.
+                the float16 output of the Modal embedder)
             batch_size: Number of points to upload per batch
         """
         if len(chunks) != len(vectors):
@@ -143,6 +250,9 @@ class JuraGPTQdrantClient:
         for i in range(0, total_chunks, batch_size):
             batch_chunks = chunks[i : i + batch_size]
             batch_vectors = vectors[i : i + batch_size]
+            if isinstance(batch_vectors, np.ndarray):
+                # Qdrant stores float32; convert one batch at a time
+                batch_vectors = batch_vectors.astype(np.float32).tolist()
 
             # Create points with hash-based IDs to prevent collisions
             points = []
@@ -187,7 +297,7 @@ class JuraGPTQdrantClient:
         self,
         query_vector: List[float],
         top_k: int = 5,
-        filters: Optional[Dict[str, Any]] = None,
+        filters: Optional[Union[Dict[str, Any], Filter]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search for similar documents.
@@ -195,20 +305,13 @@ class JuraGPTQdrantClient:
         Args:
             query_vector: Query embedding vector
             top_k: Number of results to return
-            filters: Optional filters (e.g., {"type": "statute", "law": "BGB"})
+            filters: Optional filters (e.g., {"type": "statute", "law": "BGB"} or
+                {"law": ["BGB", "HGB"]}), or a prebuilt Filter that is passed through unchanged
 
         Returns:
             List of search results with scores and metadata
         """
-        # Build Qdrant filter if provided
-        qdrant_filter = None
-        if filters:
-            conditions = []
-            for key, value in filters.items():
-                conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
-
-            if conditions:
-                qdrant_filter = Filter(must=conditions)
+        qdrant_filter = self._build_filter(filters)
 
         # Perform search
         try:
@@ -217,29 +320,11 @@ class JuraGPTQdrantClient:
                 query_vector=query_vector,
                 limit=top_k,
                 query_filter=qdrant_filter,
+                search_params=QUANTIZED_SEARCH_PARAMS,
             )
 
             # Format results
-            formatted_results = []
-            for result in results:
-                formatted_results.append(
-                    {
-                        "text": result.payload.get("text"),
-                        "title": result.payload.get("title"),
-                        "source": result.payload.get("law") or result.payload.get("court"),
-                        "url": result.payload.get("url"),
-                        "score": result.score,
-                        "metadata": {
-                            "type": result.payload.get("type"),
-                            "jurisdiction": result.payload.get("jurisdiction"),
-                            "law": result.payload.get("law"),
-                            "court": result.payload.get("court"),
-                            "section": result.payload.get("section"),
-                            "date": result.payload.get("date"),
-                            "case_id": result.payload.get("case_id"),
-                        },
-                    }
-                )
+            formatted_results = [self._format_result(result) for result in results]
 
             logger.info(f"Found {len(formatted_results)} results")
             return formatted_results
@@ -248,6 +333,105 @@ class JuraGPTQdrantClient:
             logger.error(f"Error searching: {e}")
             raise
 
+    def search_batch(
+        self,
+        query_vectors: Sequence[List[float]],
+        top_k: int = 5,
+        filters: Optional[Sequence[Optional[Union[Dict[str, Any], Filter]]]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several similarity searches in a single round trip.
+
+        Args:
+            query_vectors: Query embedding vectors
+            top_k: Number of results to return per query
+            filters: Optional per-query filters (same forms as search), aligned with query_vectors
+
+        Returns:
+            One list of formatted search results per query vector
+        """
+        if filters is not None and len(filters) != len(query_vectors):
+            raise ValueError("Number of filters must match number of query vectors")
+
+        requests = [
+            QueryRequest(
+                query=vector,
+                filter=self._build_filter(filters[i] if filters is not None else None),
+                limit=top_k,
+                params=QUANTIZED_SEARCH_PARAMS,
+                with_payload=True,
+            )
+            for i, vector in enumerate(query_vectors)
+        ]
+
+        try:
+            responses = self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=requests,
+            )
+
+            formatted = [
+                [self._format_result(point) for point in response.points]
+                for response in responses
+            ]
+
+            logger.info(f"Batch search: {len(formatted)} queries, {sum(map(len, formatted))} results")
+            return formatted
+
+        except Exception as e:
+            logger.error(f"Error in batch search: {e}")
+            raise
+
+    @staticmethod
+    def _build_filter(filters: Optional[Union[Dict[str, Any], Filter]]) -> Optional[Filter]:
+        """
+        Build Qdrant filter from a dict of field conditions.
+
+        List, tuple or set values match any of the given values. A prebuilt
+        Filter is returned unchanged.
+        """
+        if isinstance(filters, Filter):
+            return filters
+        if not filters:
+            return None
+
+        conditions = []
+        for key, value in filters.items():
+            if isinstance(value, (list, tuple, set, frozenset)):
+                conditions.append(FieldCondition(key=key, match=MatchAny(any=list(value))))
+            else:
+                conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
+
+        return Filter(must=conditions)
+
+    @staticmethod
+    def _format_result(result) -> Dict[str, Any]:
+        """
+        Convert a scored Qdrant point into the result dictionary format.
+
+        The dict is final (text is never None), so API responses serialize it
+        as-is instead of copying it into another result object.
+        """
+        get = result.payload.get
+        law = get("law")
+        court = get("court")
+        return {
+            "text": get("text") or "",
+            "title": get("title"),
+            "source": law or court,
+            "url": get("url"),
+            "score": result.score,
+            "metadata": {
+                "type": get("type"),
+                "jurisdiction": get("jurisdiction"),
+                "law": law,
+                "court": court,
+                "section": get("section"),
+                "date": get("date"),
+                "case_id": get("case_id"),
+            },
+        }
+
     def get_collection_info(self) -> Dict[str, Any]:
         """Get information about the collection."""
         try:
@@ -270,3 +454,107 @@ class JuraGPTQdrantClient:
         except Exception as e:
             logger.error(f"Error deleting collection: {e}")
             raise
+
+
+class AsyncJuraGPTQdrantClient:
+    """
+    Async Qdrant client for the retrieval API's read path.
+
+    Awaits searches over gRPC instead of blocking the event loop (or a
+    worker thread) on the sync client. Filter building and result
+    formatting are shared with JuraGPTQdrantClient.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        collection_name: Optional[str] = None,
+        pool_size: Optional[int] = None,
+    ):
+        """
+        Initialize async Qdrant client.
+
+        Args:
+            url: Qdrant server URL (defaults to env QDRANT_URL)
+            api_key: Qdrant API key (defaults to env QDRANT_API_KEY)
+            collection_name: Collection name (defaults to env QDRANT_COLLECTION)
+            pool_size: Connection pool size (defaults to env QDRANT_POOL_SIZE or 100).
+                Must be >= the number of concurrent in-flight requests.
+        """
+        self.url = url or os.getenv("QDRANT_URL")
+        self.api_key = api_key or os.getenv("QDRANT_API_KEY")
+        self.collection_name = collection_name or os.getenv(
+            "QDRANT_COLLECTION", "juragpt_public_law"
+        )
+        self.pool_size = pool_size or int(os.getenv("QDRANT_POOL_SIZE", "100"))
+
+        if not self.url or not self.api_key:
+            raise ValueError(
+                "Qdrant URL and API key must be provided via parameters or environment variables"
+            )
+
+        self.client = AsyncQdrantClient(
+            url=self.url,
+            api_key=self.api_key,
+            prefer_grpc=True,
+            timeout=60,
+            pool_size=self.pool_size,
+        )
+        logger.info(
+            f"Connected async client to Qdrant at {self.url} (prefer_grpc=True, pool_size={self.pool_size})"
+        )
+
+    async def search(
+        self,
+        query_vector: List[float],
+        top_k: int = 5,
+        filters: Optional[Union[Dict[str, Any], Filter]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for similar documents.
+
+        Args:
+            query_vector: Query embedding vector
+            top_k: Number of results to return
+            filters: Optional filters, same forms as JuraGPTQdrantClient.search
+
+        Returns:
+            List of search results with scores and metadata
+        """
+        try:
+            response = await self.client.query_points(
+                collection_name=self.collection_name,
+                query=query_vector,
+                limit=top_k,
+                query_filter=JuraGPTQdrantClient._build_filter(filters),
+                search_params=QUANTIZED_SEARCH_PARAMS,
+                with_payload=True,
+            )
+
+            formatted_results = [JuraGPTQdrantClient._format_result(point) for point in response.points]
+
+            logger.info(f"Found {len(formatted_results)} results")
+            return formatted_results
+
+        except Exception as e:
+            logger.error(f"Error searching: {e}")
+            raise
+
+    async def get_collection_info(self) -> Dict[str, Any]:
+        """Get information about the collection."""
+        try:
+            collection_info = await self.client.get_collection(self.collection_name)
+            return {
+                "name": self.collection_name,
+                "vectors_count": collection_info.vectors_count,
+                "points_count": collection_info.points_count,
+                "status": collection_info.status,
+            }
+        except Exception as e:
+            logger.error(f"Error getting collection info: {e}")
+            raise
+
+    async def close(self):
+        """Close underlying connections."""
+        await self.client.close()
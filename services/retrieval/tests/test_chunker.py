@@ -0,0 +1,148 @@
+"""
+Tests for TextChunker - splitting legal documents into embedding chunks.
+
+Tests cover:
+- Sliding-window progress when the break point falls within the overlap
+- Section-marker breaks in the sliding window
+- Paragraph splitting on blank and whitespace-only lines
+- Sentence packing with overlap (blingfire backend)
+- Batches bounded by target_chars_per_batch
+- Identical output with worker processes
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.processing.chunker import BLINGFIRE_AVAILABLE, TextChunker
+
+FIRST_SECTION = "§ 1 Erster Abschnitt\n" + "Lorem ipsum dolor sit amet consectetur " * 4 + "do"
+SECOND_SECTION = "§ 2 Zweiter Abschnitt\n" + "Sed ut perspiciatis unde omnis iste " * 4
+SENTENCES = [f"Der Kläger verlangt Ersatz für Schaden Nummer {i}." for i in range(12)]
+
+
+def make_documents(count: int, text: str):
+    """Documents with the same text and distinct ids."""
+    return [{"doc_id": f"doc-{i}", "title": f"Dokument {i}", "text": text} for i in range(count)]
+
+
+class TestSlidingWindow:
+    """Test suite for sliding-window chunking of long paragraphs."""
+
+    @pytest.fixture
+    def chunker(self, tmp_path) -> TextChunker:
+        """Chunker with small windows (200 chars, 50 overlap)."""
+        return TextChunker(chunk_size=200, chunk_overlap=50, output_dir=str(tmp_path))
+
+    def test_break_within_overlap_advances(self, tmp_path):
+        """A word break inside the overlap still moves the window forward."""
+        chunker = TextChunker(chunk_size=20, chunk_overlap=15, output_dir=str(tmp_path))
+
+        chunks = chunker._sliding_window_chunk("ab " + "x" * 60)
+
+        assert chunks[0] == "ab"
+        assert all(set(chunk) == {"x"} and len(chunk) <= 20 for chunk in chunks[1:])
+
+    def test_windows_overlap(self, chunker):
+        """Consecutive windows share up to chunk_overlap characters."""
+        text = " ".join(f"wort{i:03d}" for i in range(100))
+
+        chunks = chunker._sliding_window_chunk(text)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 200 for chunk in chunks)
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current[:40] in previous
+
+    def test_section_break_starts_next_chunk_at_heading(self, chunker):
+        """A break on a section heading carries no overlap into the next section."""
+        chunks = chunker._sliding_window_chunk(f"{FIRST_SECTION}\n{SECOND_SECTION}")
+
+        assert chunks[0] == FIRST_SECTION
+        assert chunks[1].startswith("§ 2 Zweiter Abschnitt")
+        assert not any("Lorem" in chunk for chunk in chunks[1:])
+
+
+class TestParagraphs:
+    """Test suite for paragraph-preserving chunking."""
+
+    @pytest.fixture
+    def chunker(self, tmp_path) -> TextChunker:
+        """Chunker that fits one or two short paragraphs per chunk."""
+        return TextChunker(chunk_size=45, chunk_overlap=10, output_dir=str(tmp_path))
+
+    @pytest.mark.parametrize("separator", ["\n\n", "\n \n", "\n\t\n\n", "\n\n\n"])
+    def test_blank_line_variants_split_paragraphs(self, chunker, separator):
+        """Whitespace-only and repeated blank lines separate paragraphs like one blank line."""
+        paragraphs = ["Erster Absatz hier.", "Zweiter Absatz hier.", "Dritter Absatz da."]
+
+        chunks = chunker.chunk_text(separator.join(paragraphs))
+
+        assert chunks == [
+            "Erster Absatz hier.\n\nZweiter Absatz hier.",
+            "Zweiter Absatz hier.\n\nDritter Absatz da.",
+        ]
+
+
+@pytest.mark.skipif(not BLINGFIRE_AVAILABLE, reason="blingfire not installed")
+class TestSentencePacking:
+    """Test suite for the blingfire sentence-packing backend."""
+
+    def test_whole_sentences_with_overlap(self, tmp_path):
+        """Chunks hold whole sentences and repeat the previous chunk's last sentence."""
+        chunker = TextChunker(
+            chunk_size=200, chunk_overlap=60, output_dir=str(tmp_path), backend="sentences"
+        )
+
+        chunks = chunker.chunk_text(" ".join(SENTENCES))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 200 for chunk in chunks)
+        assert all(chunk.startswith("Der Kläger") and chunk.endswith(".") for chunk in chunks)
+        for previous, current in zip(chunks, chunks[1:]):
+            last_sentence = previous[previous.rindex("Der Kläger"):]
+            assert current.startswith(last_sentence)
+        assert all(sentence in " ".join(chunks) for sentence in SENTENCES)
+
+
+class TestBatched:
+    """Test suite for batched chunking."""
+
+    @pytest.fixture
+    def chunker(self, tmp_path) -> TextChunker:
+        """Chunker with small windows (200 chars, 50 overlap)."""
+        return TextChunker(chunk_size=200, chunk_overlap=50, output_dir=str(tmp_path))
+
+    def test_batch_ends_at_char_budget(self, chunker):
+        """A batch ends once its documents reach target_chars_per_batch."""
+        documents = make_documents(7, "Satz eins. " * 5)  # 55 chars, one chunk each
+
+        batches = chunker.chunk_documents_batched(
+            documents, batch_size=3, target_chars_per_batch=100
+        )
+
+        assert [len(batch) for batch in batches] == [2, 2, 2, 1]
+
+    def test_null_text_is_skipped(self, chunker):
+        """Documents with "text": None produce no chunks instead of failing."""
+        documents = [{"doc_id": "empty", "text": None}] + make_documents(1, "Satz eins.")
+
+        chunks = list(chunker.iter_chunk_documents_batched(documents))
+
+        assert [chunk["chunk_id"] for chunk in chunks] == ["doc-0_chunk_0"]
+
+    def test_workers_match_in_process(self, chunker):
+        """Worker processes produce the same chunks, in the same order."""
+        documents = make_documents(6, f"{FIRST_SECTION}\n{SECOND_SECTION}")
+
+        in_process = list(chunker.chunk_documents_batched(documents, batch_size=4, workers=1))
+        parallel = list(chunker.chunk_documents_batched(documents, batch_size=4, workers=2))
+
+        assert parallel == in_process
+        assert [chunk for batch in in_process for chunk in batch] == list(
+            chunker.iter_chunk_documents_batched(documents, batch_size=4, workers=2)
+        )
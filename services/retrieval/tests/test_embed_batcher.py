@@ -0,0 +1,78 @@
+"""
+Tests for EmbeddingBatcher - asyncio coalescing of query embeddings.
+
+Tests cover:
+- Concurrent submits share one encoder call
+- max_batch splits large bursts
+- Encoder errors propagate to every caller
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.api.embed_batcher import EmbeddingBatcher
+
+
+class TestEmbeddingBatcher:
+    """Test suite for EmbeddingBatcher."""
+
+    @pytest.fixture
+    def calls(self):
+        """Record of batches passed to the encoder."""
+        return []
+
+    @pytest.fixture
+    def encode(self, calls):
+        """Fake encoder returning [len(query)] per query."""
+
+        def _encode(queries):
+            calls.append(list(queries))
+            return [[float(len(q))] for q in queries]
+
+        return _encode
+
+    def test_concurrent_submits_are_coalesced(self, encode, calls):
+        """Queries submitted together are encoded in one call, in order."""
+
+        async def run():
+            batcher = EmbeddingBatcher(encode, max_batch=32, max_wait_seconds=0.05)
+            vectors = await asyncio.gather(*(batcher.submit("q" * n) for n in (1, 2, 3)))
+            await batcher.stop()
+            return vectors
+
+        assert asyncio.run(run()) == [[1.0], [2.0], [3.0]]
+        assert calls == [["q", "qq", "qqq"]]
+
+    def test_max_batch_splits_burst(self, encode, calls):
+        """No encoder call exceeds max_batch queries."""
+
+        async def run():
+            batcher = EmbeddingBatcher(encode, max_batch=2, max_wait_seconds=0.05)
+            await asyncio.gather(*(batcher.submit(str(i)) for i in range(5)))
+            await batcher.stop()
+
+        asyncio.run(run())
+        assert [len(batch) for batch in calls] == [2, 2, 1]
+
+    def test_encoder_error_propagates(self):
+        """Every caller in a failed batch sees the exception."""
+
+        def failing(queries):
+            raise RuntimeError("model not loaded")
+
+        async def run():
+            batcher = EmbeddingBatcher(failing, max_wait_seconds=0.05)
+            results = await asyncio.gather(
+                batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+            )
+            await batcher.stop()
+            return results
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,57 @@
+"""
+Tests for EmbeddingCache - persistent content-hash embedding cache.
+
+Tests cover:
+- Round trip of stored vectors
+- Persistence across instances
+- Model isolation
+- Statistics
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.embedding.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Test suite for EmbeddingCache."""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path) -> Path:
+        """Path of a fresh cache database."""
+        return tmp_path / "embeddings.sqlite"
+
+    def test_round_trip(self, cache_path):
+        """Stored vectors come back for the same text only."""
+        cache = EmbeddingCache(str(cache_path), "model-a")
+        cache.put_many([("passage: § 823 BGB", [0.5, 0.25, -1.0])])
+
+        found = cache.get_many(["passage: § 823 BGB", "passage: § 433 BGB"])
+
+        assert found == {"passage: § 823 BGB": [0.5, 0.25, -1.0]}
+
+    def test_persists_across_instances(self, cache_path):
+        """A new instance on the same file sees earlier writes."""
+        EmbeddingCache(str(cache_path), "model-a").put_many([("text", [1.0, 0.0])])
+
+        assert EmbeddingCache(str(cache_path), "model-a").get_many(["text"]) == {"text": [1.0, 0.0]}
+
+    def test_model_isolation(self, cache_path):
+        """Vectors of one model are never returned for another."""
+        EmbeddingCache(str(cache_path), "model-a").put_many([("text", [1.0, 0.0])])
+
+        assert EmbeddingCache(str(cache_path), "model-b").get_many(["text"]) == {}
+
+    def test_stats(self, cache_path):
+        """Hits and misses count unique texts."""
+        cache = EmbeddingCache(str(cache_path), "model-a")
+        cache.put_many([("a", [1.0])])
+        cache.get_many(["a", "a", "b"])
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
@@ -0,0 +1,71 @@
+"""
+Tests for EURLexDataset - Parquet cache of parsed documents.
+
+Tests cover:
+- Cached documents equal freshly parsed ones
+- Cache invalidation when a file is rewritten in place
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import os
+
+import orjson
+import pytest
+
+from src.crawlers.eurlex_dataset import PYARROW_AVAILABLE, EURLexDataset
+
+pytestmark = pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+
+BODY = "The Member States shall adopt the laws, regulations and administrative provisions necessary."
+
+
+def write_document(path: Path, data: dict):
+    """Write one EURLEX57K-style JSON file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(data))
+
+
+class TestParsedCache:
+    """Test suite for the parsed-document cache."""
+
+    @pytest.fixture
+    def dataset(self, tmp_path) -> EURLexDataset:
+        """Dataset with two extracted documents, one without concepts."""
+        dataset = EURLexDataset(data_dir=str(tmp_path))
+        write_document(
+            dataset.extract_dir / "train" / "32014L0001.json",
+            {"header": "DIRECTIVE 2014/1/EU", "main_body": [BODY], "concepts": ["1234", "directive"]},
+        )
+        write_document(
+            dataset.extract_dir / "train" / "32014R0002.json",
+            {"header": "REGULATION (EU) 2014/2", "main_body": [BODY, BODY]},
+        )
+        return dataset
+
+    def test_cache_round_trip(self, dataset):
+        """Documents loaded from the cache equal the freshly parsed ones."""
+        parsed = dataset.load_documents(max_workers=1)
+        assert dataset.parsed_cache.exists()
+
+        assert dataset.load_documents(max_workers=1) == parsed
+        assert dataset.load_documents(limit=1, max_workers=1) == parsed[:1]
+
+    def test_file_rewritten_in_place_invalidates_cache(self, dataset):
+        """Rewriting an existing JSON file (directory mtime unchanged) re-parses."""
+        dataset.load_documents(max_workers=1)
+
+        path = dataset.extract_dir / "train" / "32014R0002.json"
+        directory_mtime = path.parent.stat().st_mtime_ns
+        write_document(path, {"header": "REGULATION (EU) 2014/2", "main_body": [BODY, "Amended."]})
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert path.parent.stat().st_mtime_ns == directory_mtime
+
+        documents = {doc["doc_id"]: doc for doc in dataset.load_documents(max_workers=1)}
+
+        assert documents["eurlex-32014R0002"]["text"].endswith("Amended.")
@@ -0,0 +1,72 @@
+"""
+Tests for HTTPCache - conditional-request response cache for crawlers.
+
+Tests cover:
+- Cache keys independent of parameter order
+- Conditional headers from stored validators
+- Storing only revalidatable responses
+- Persistence across instances
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import requests
+
+from src.crawlers.http_cache import CachedResponse, HTTPCache
+
+
+def make_response(body: bytes, headers: dict) -> requests.Response:
+    """Build a 200 response with the given body and headers."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers.update(headers)
+    return response
+
+
+class TestHTTPCache:
+    """Test suite for HTTPCache."""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path) -> Path:
+        """Path of a fresh cache database."""
+        return tmp_path / "http_cache.sqlite"
+
+    def test_key_ignores_param_order(self):
+        """The same parameters in any order map to one key."""
+        url = "https://de.openlegaldata.io/api/cases/"
+
+        assert HTTPCache.key(url, {"page": 2, "court": "bgh"}) == HTTPCache.key(
+            url, {"court": "bgh", "page": 2}
+        )
+        assert HTTPCache.key(url) == url
+
+    def test_conditional_headers(self):
+        """Stored validators become If-None-Match / If-Modified-Since."""
+        cached = CachedResponse('"v1"', "Mon, 01 Jan 2024 00:00:00 GMT", b"{}")
+
+        assert HTTPCache.conditional_headers(cached) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        assert HTTPCache.conditional_headers(None) == {}
+
+    def test_stores_only_revalidatable_responses(self, cache_path):
+        """Responses without ETag or Last-Modified are not stored."""
+        cache = HTTPCache(str(cache_path))
+        cache.put("a", make_response(b'{"results": []}', {"ETag": '"v1"'}))
+        cache.put("b", make_response(b'{"results": []}', {}))
+
+        assert cache.get("a") == CachedResponse('"v1"', None, b'{"results": []}')
+        assert cache.get("b") is None
+
+    def test_persists_across_instances(self, cache_path):
+        """A new instance on the same file sees earlier writes."""
+        HTTPCache(str(cache_path)).put("a", make_response(b"[1]", {"Last-Modified": "x"}))
+
+        assert HTTPCache(str(cache_path)).get("a").body == b"[1]"
@@ -0,0 +1,58 @@
+"""
+Tests for the shared crawler JSONL reader/writer.
+
+Tests cover:
+- Round trip of plain and gzip-compressed files
+- Blank lines and empty files
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import gzip
+
+import pytest
+
+from src.crawlers.jsonl import read_jsonl, write_jsonl
+
+DOCUMENTS = [
+    {"doc_id": "bgb-823", "text": "Wer vorsätzlich oder fahrlässig ...", "section": "823"},
+    {"doc_id": "gg-1", "text": "Die Würde des Menschen ist unantastbar.", "section": None},
+]
+
+
+class TestJSONL:
+    """Test suite for read_jsonl / write_jsonl."""
+
+    @pytest.mark.parametrize("filename", ["docs.jsonl", "docs.jsonl.gz"])
+    def test_round_trip(self, tmp_path, filename):
+        """Documents read back unchanged, with or without compression."""
+        path = tmp_path / filename
+        write_jsonl(path, DOCUMENTS)
+
+        assert read_jsonl(path) == DOCUMENTS
+
+    def test_gz_suffix_compresses(self, tmp_path):
+        """A ".gz" file is gzip-compressed JSONL."""
+        path = tmp_path / "docs.jsonl.gz"
+        write_jsonl(path, DOCUMENTS)
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert len(f.read().splitlines()) == len(DOCUMENTS)
+
+    def test_skips_blank_lines(self, tmp_path):
+        """Blank and whitespace-only lines are ignored."""
+        path = tmp_path / "docs.jsonl"
+        path.write_bytes(b'{"doc_id": "a"}\n\n  \n{"doc_id": "b"}\n')
+
+        assert read_jsonl(path) == [{"doc_id": "a"}, {"doc_id": "b"}]
+
+    def test_empty_file(self, tmp_path):
+        """An empty file holds no documents."""
+        path = tmp_path / "docs.jsonl"
+        path.touch()
+
+        assert read_jsonl(path) == []
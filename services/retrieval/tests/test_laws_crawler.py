@@ -0,0 +1,152 @@
+"""
+Tests for LawsCrawler - conditional section requests via HTTPCache.
+
+Tests cover:
+- Validators stored on the first crawl
+- Cached page reused on 304 Not Modified
+- Crawling without a cache
+- Section pages decoded in their declared charset
+- Adaptive request rate
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import requests
+
+from src.crawlers import laws
+from src.crawlers.laws import LawsCrawler
+
+SECTION_URL = "https://www.gesetze-im-internet.de/bgb/__823.html"
+SECTION_HTML = (
+    "<html><body><div class='jnhtml'><div class='jurAbsatz'>"
+    "(1) Wer vorsätzlich oder fahrlässig das Leben, den Körper, die Gesundheit, "
+    "die Freiheit, das Eigentum oder ein sonstiges Recht eines anderen widerrechtlich "
+    "verletzt, ist dem anderen zum Ersatz des daraus entstehenden Schadens verpflichtet."
+    "</div></div></body></html>"
+).encode("utf-8").ljust(600)
+
+
+def make_response(status_code: int, body: bytes = b"", headers: dict = None) -> requests.Response:
+    """Build a response with the given status, body and headers."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeSession:
+    """Session returning queued responses and recording request headers."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(headers or {})
+        return self.responses.pop(0)
+
+
+class TestSectionCache:
+    """Test suite for conditional section crawling."""
+
+    @pytest.fixture
+    def crawler(self, tmp_path) -> LawsCrawler:
+        """Crawler writing its cache into a temporary directory."""
+        return LawsCrawler(output_dir=str(tmp_path))
+
+    def crawl(self, crawler: LawsCrawler):
+        """Crawl the test section."""
+        return crawler._crawl_section("bgb", "Bürgerliches Gesetzbuch", "823", "§ 823", SECTION_URL)
+
+    def test_not_modified_reuses_cached_page(self, crawler):
+        """A 304 answer yields the same document as the original page."""
+        crawler.session = FakeSession(
+            [make_response(200, SECTION_HTML, {"ETag": '"v1"'}), make_response(304)]
+        )
+
+        first = self.crawl(crawler)
+        second = self.crawl(crawler)
+
+        assert first["doc_id"] == "bgb-823"
+        assert second == first
+        assert crawler.session.sent_headers == [{}, {"If-None-Match": '"v1"'}]
+
+    def test_cache_disabled(self, tmp_path):
+        """With cache_path="none" no conditional headers are sent."""
+        crawler = LawsCrawler(output_dir=str(tmp_path), cache_path="none")
+        crawler.session = FakeSession(
+            [make_response(200, SECTION_HTML, {"ETag": '"v1"'})] * 2
+        )
+
+        self.crawl(crawler)
+        self.crawl(crawler)
+
+        assert crawler.http_cache is None
+        assert crawler.session.sent_headers == [{}, {}]
+
+
+SECTION_TEXT = "§ 1 Geltungsbereich für Bürger"
+
+
+class TestSectionCharset:
+    """Test suite for decoding section pages in their declared charset."""
+
+    @pytest.fixture(params=[True, False], ids=["lexbor", "lxml"])
+    def backend(self, request, monkeypatch):
+        """Run each test with selectolax and with the lxml fallback."""
+        if request.param and not laws.SELECTOLAX_AVAILABLE:
+            pytest.skip("selectolax not installed")
+        monkeypatch.setattr(laws, "SELECTOLAX_AVAILABLE", request.param)
+
+    @pytest.mark.parametrize(
+        "page",
+        [
+            f'<html><head><meta charset="iso-8859-1"></head><body><p>{SECTION_TEXT}</p></body></html>'.encode("latin-1"),
+            (
+                '<html><head><meta http-equiv="Content-Type" content="text/html; charset=windows-1252">'
+                f"</head><body><p>{SECTION_TEXT}</p></body></html>"
+            ).encode("cp1252"),
+            f"<html><body><p>{SECTION_TEXT}</p></body></html>".encode("utf-8"),
+            f'<?xml version="1.0" encoding="UTF-8"?><html><body><p>{SECTION_TEXT}</p></body></html>'.encode("utf-8"),
+        ],
+        ids=["latin-1 meta", "cp1252 http-equiv", "utf-8 undeclared", "utf-8 xml declaration"],
+    )
+    def test_section_text_decoded(self, backend, page):
+        """Umlauts and § survive whatever charset the page declares."""
+        assert laws.select_section_text(page) == [SECTION_TEXT]
+
+    def test_section_links_decoded(self, backend):
+        """TOC link texts of a Latin-1 page are decoded with its charset."""
+        page = (
+            '<html><head><meta charset="iso-8859-1"></head><body>'
+            f'<a href="__1.html">{SECTION_TEXT}</a></body></html>'
+        ).encode("latin-1")
+
+        assert laws.select_section_links(page) == [("__1.html", SECTION_TEXT)]
+
+
+class TestAdaptiveRate:
+    """Test suite for the shared adaptive request rate."""
+
+    def test_rate_configurable(self, tmp_path, monkeypatch):
+        """LAWS_CRAWLER_RATE sets the initial rate."""
+        monkeypatch.setenv("LAWS_CRAWLER_RATE", "5")
+
+        assert LawsCrawler(output_dir=str(tmp_path), cache_path="none").rate_limiter.rate == 5.0
+
+    def test_rate_follows_responses(self, tmp_path):
+        """Normal answers raise the rate; throttling halves it."""
+        crawler = LawsCrawler(output_dir=str(tmp_path), cache_path="none", rate=4.0)
+        crawler.session = FakeSession([make_response(200, SECTION_HTML), make_response(429)])
+
+        crawler._get(SECTION_URL)
+        assert crawler.rate_limiter.rate > 4.0
+
+        crawler._get(SECTION_URL)
+        assert crawler.rate_limiter.rate < 4.0
@@ -0,0 +1,68 @@
+"""
+Tests for TextNormalizer - cleaning legal text before chunking.
+
+Tests cover:
+- HTML tag removal and single entity decoding
+- Unicode NFC normalization
+- Whitespace, no-break space and line ending normalization
+- § / Abs. / Nr. spacing
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.processing.normalizer import TextNormalizer
+
+
+@pytest.fixture
+def normalizer() -> TextNormalizer:
+    """Normalizer with its compiled patterns."""
+    return TextNormalizer()
+
+
+class TestNormalize:
+    """Test suite for TextNormalizer.normalize."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("Gr&uuml;&szlig;e", "Grüße"),  # Named entities
+            ("&#167; 823 und &#x00A7; 1", "§823 und §1"),  # Numeric entities, then § spacing
+            ("&amp;lt;b&amp;gt;", "&lt;b&gt;"),  # Double-escaped input is decoded once
+            ("<p>a &lt;b&gt; c</p>", "a <b> c"),  # Tags are stripped before decoding
+        ],
+    )
+    def test_entities(self, normalizer, text, expected):
+        """Entities are decoded exactly once, after tags are removed."""
+        assert normalizer.normalize(text) == expected
+
+    def test_nfc(self, normalizer):
+        """Decomposed umlauts are composed."""
+        assert normalizer.normalize("u\u0308ber") == "\u00fcber"
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("a\xa0\xa0 b\xa0c", "a b c"),  # No-break spaces collapse like spaces
+            ("a \t  b", "a b"),
+            ("a\r\n\r\n\r\n\r\nb", "a\n\nb"),  # CRLF runs become one paragraph break
+            ("a\r\nb\rc", "a\nb\nc"),
+            ("  a\n\n\n\n\nb  ", "a\n\nb"),
+        ],
+    )
+    def test_whitespace(self, normalizer, text, expected):
+        """Spaces, tabs, no-break spaces and line endings are normalized."""
+        assert normalizer.normalize(text) == expected
+
+    def test_legal_reference_spacing(self, normalizer):
+        """§ is joined to its number; Abs. and Nr. take a single space."""
+        assert normalizer.normalize("§  5 und Abs.   3 Nr.\t2") == "§5 und Abs. 3 Nr. 2"
+
+    def test_empty(self, normalizer):
+        """Empty input stays empty."""
+        assert normalizer.normalize("") == ""
@@ -0,0 +1,101 @@
+"""
+Tests for OpenLegalDataAPI - normalization of API records.
+
+Tests cover:
+- HTML to text with encoding declarations
+- Records with null or missing HTML content
+- Fallback to the plain text field for laws
+- In-process normalization of small pages, worker pool for large ones
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.crawlers.openlegaldata_api import PROCESS_POOL_MIN_CHARS, OpenLegalDataAPI, html_to_text
+
+LAW_TEXT = "Die Würde des Menschen ist unantastbar. Sie zu achten ist Verpflichtung aller staatlichen Gewalt."
+
+
+class TestHTMLToText:
+    """Test suite for html_to_text."""
+
+    def test_one_text_node_per_line(self):
+        """Text nodes are stripped and joined by newlines; scripts are dropped."""
+        markup = "<h1>Urteil</h1><p> Tenor &amp; Gründe </p><script>x = 1</script>"
+
+        assert html_to_text(markup) == "Urteil\nTenor & Gründe"
+
+    def test_xml_encoding_declaration(self):
+        """Markup with an XML encoding declaration is parsed, not rejected."""
+        markup = '<?xml version="1.0" encoding="UTF-8"?><p>Grüße &amp; mehr</p>'
+
+        assert html_to_text(markup) == "Grüße & mehr"
+
+    def test_meta_charset_does_not_change_decoding(self):
+        """A declared legacy charset does not garble the (already decoded) text."""
+        markup = '<html><head><meta charset="iso-8859-1"></head><body><p>Grüße</p></body></html>'
+
+        assert html_to_text(markup) == "Grüße"
+
+
+class TestNormalization:
+    """Test suite for case and law normalization."""
+
+    def test_law_with_null_content_uses_text(self):
+        """A law with "content": null falls back to its text field."""
+        law = OpenLegalDataAPI._normalize_law(
+            {"slug": "gg-art-1", "abbreviation": "GG", "content": None, "text": LAW_TEXT}
+        )
+
+        assert law is not None
+        assert law["text"] == LAW_TEXT
+
+    def test_law_with_html_content(self):
+        """HTML content is converted to text."""
+        law = OpenLegalDataAPI._normalize_law(
+            {"slug": "gg-art-1", "abbreviation": "GG", "content": f"<p>{LAW_TEXT}</p>"}
+        )
+
+        assert law["text"] == LAW_TEXT
+
+    def test_case_with_null_content_is_skipped(self):
+        """A case with "content": null is skipped, not an error."""
+        assert OpenLegalDataAPI._normalize_case({"slug": "bgh-1", "content": None}) is None
+
+
+class TestNormalizePage:
+    """Test suite for per-page normalization."""
+
+    def test_small_page_is_normalized_in_process(self):
+        """Pages with little HTML do not start worker processes."""
+        api = OpenLegalDataAPI(cache_path="none")
+        results = [
+            {"slug": f"gg-art-{i}", "abbreviation": "GG", "content": f"<p>{LAW_TEXT}</p>"}
+            for i in range(3)
+        ]
+
+        laws = list(api._normalize_page(api._normalize_law, results))
+
+        assert [law["doc_id"] for law in laws] == ["gg-art-0", "gg-art-1", "gg-art-2"]
+        assert api._normalize_executor is None
+        api.close()
+
+    def test_large_page_is_normalized_in_worker_processes(self):
+        """Pages above the threshold go through the worker pool, keeping result order."""
+        api = OpenLegalDataAPI(cache_path="none", max_workers=2)
+        html = f"<p>{LAW_TEXT}</p>" * (PROCESS_POOL_MIN_CHARS // len(LAW_TEXT))
+        results = [
+            {"slug": f"gg-art-{i}", "abbreviation": "GG", "content": html} for i in range(4)
+        ]
+
+        try:
+            laws = list(api._normalize_page(api._normalize_law, results))
+
+            assert [law["doc_id"] for law in laws] == [f"gg-art-{i}" for i in range(4)]
+            assert api._normalize_executor is not None
+        finally:
+            api.close()
+        assert api._normalize_executor is None
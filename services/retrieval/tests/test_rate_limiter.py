@@ -0,0 +1,88 @@
+"""
+Tests for TokenBucket - crawler request rate limiting.
+
+Tests cover:
+- Bursts up to capacity without waiting
+- Waiting for refill once empty
+- Refill capped at capacity
+- Adaptive rate on success/failure feedback
+- Pausing on server request
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.crawlers import rate_limiter
+from src.crawlers.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Fake monotonic clock; sleep advances it."""
+        now = [1000.0]
+        monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(rate_limiter.time, "sleep", lambda s: now.__setitem__(0, now[0] + s))
+        return now
+
+    def test_burst_up_to_capacity(self, clock):
+        """A full bucket serves `capacity` requests immediately."""
+        bucket = TokenBucket(capacity=3, rate=1.0)
+
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_waits_for_refill_when_empty(self, clock):
+        """Once empty, each request waits 1/rate seconds."""
+        bucket = TokenBucket(capacity=1, rate=2.0)
+        bucket.acquire()
+
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(0.5)
+
+    def test_refill_capped_at_capacity(self, clock):
+        """Idle time never banks more than `capacity` tokens."""
+        bucket = TokenBucket(capacity=2, rate=1.0)
+        bucket.acquire()
+        bucket.acquire()
+        clock[0] += 60
+
+        assert [bucket.acquire() for _ in range(2)] == [0.0, 0.0]
+        assert bucket.acquire() == pytest.approx(1.0)
+
+    def test_failure_halves_rate_and_empties_bucket(self, clock):
+        """on_failure backs off multiplicatively down to min_rate."""
+        bucket = TokenBucket(capacity=5, rate=2.0, min_rate=0.5, max_rate=4.0)
+
+        bucket.on_failure()
+        assert bucket.rate == 1.0
+        assert bucket.acquire() == pytest.approx(1.0)
+
+        bucket.on_failure()
+        bucket.on_failure()
+        assert bucket.rate == 0.5
+
+    def test_success_raises_rate_up_to_max(self, clock):
+        """on_success increases the rate additively, capped at max_rate."""
+        bucket = TokenBucket(capacity=5, rate=2.0, min_rate=0.5, max_rate=2.25, increase=0.1)
+
+        bucket.on_success()
+        assert bucket.rate == pytest.approx(2.1)
+
+        for _ in range(5):
+            bucket.on_success()
+        assert bucket.rate == 2.25
+
+    def test_pause_delays_next_request(self, clock):
+        """pause() makes the next acquire wait out the requested delay."""
+        bucket = TokenBucket(capacity=5, rate=2.0)
+
+        bucket.pause(30)
+        assert bucket.acquire() == pytest.approx(30.0)
+        assert bucket.acquire() == pytest.approx(0.5)
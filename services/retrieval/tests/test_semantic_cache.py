@@ -0,0 +1,148 @@
+"""
+Tests for SemanticQueryCache and ExactQueryCache - retrieval result caches.
+
+Tests cover:
+- Hits for near-duplicate queries, misses below threshold
+- Scope isolation (top_k / filters)
+- TTL expiry and LRU eviction
+- Scope ids dropped with their last entry
+- Statistics
+- Exact-key LRU tier
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.api import semantic_cache
+from src.api.semantic_cache import ExactQueryCache, SemanticQueryCache
+
+
+class TestSemanticQueryCache:
+    """Test suite for SemanticQueryCache."""
+
+    @pytest.fixture
+    def cache(self) -> SemanticQueryCache:
+        """Create small cache instance for testing."""
+        return SemanticQueryCache(max_entries=2, ttl_seconds=60, threshold=0.9)
+
+    def test_hit_for_near_duplicate_query(self, cache):
+        """Similar embeddings in the same scope return the cached value."""
+        cache.put([1.0, 0.0, 0.0], scope=(5, None), value=["bgb-433"])
+
+        assert cache.get([0.99, 0.05, 0.0], scope=(5, None)) == ["bgb-433"]
+        assert cache.hits == 1
+
+    def test_miss_below_threshold(self, cache):
+        """Dissimilar embeddings miss."""
+        cache.put([1.0, 0.0, 0.0], scope=(5, None), value=["bgb-433"])
+
+        assert cache.get([0.0, 1.0, 0.0], scope=(5, None)) is None
+        assert cache.misses == 1
+
+    def test_scope_isolation(self, cache):
+        """Entries never match lookups with a different scope."""
+        cache.put([1.0, 0.0, 0.0], scope=(5, None), value=["top5"])
+
+        assert cache.get([1.0, 0.0, 0.0], scope=(10, None)) is None
+        assert cache.get([1.0, 0.0, 0.0], scope=(5, '{"law": "BGB"}')) is None
+
+    def test_ttl_expiry(self, cache, monkeypatch):
+        """Expired entries are not returned."""
+        now = [1000.0]
+        monkeypatch.setattr(semantic_cache.time, "monotonic", lambda: now[0])
+
+        cache.put([1.0, 0.0, 0.0], scope=(5, None), value=["bgb-433"])
+        now[0] += 61
+
+        assert cache.get([1.0, 0.0, 0.0], scope=(5, None)) is None
+
+    def test_lru_eviction(self, cache):
+        """The least recently used entry is evicted when full."""
+        cache.put([1.0, 0.0, 0.0], scope=(5, None), value="a")
+        cache.put([0.0, 1.0, 0.0], scope=(5, None), value="b")
+
+        # Touch "a" so "b" becomes least recently used
+        assert cache.get([1.0, 0.0, 0.0], scope=(5, None)) == "a"
+        cache.put([0.0, 0.0, 1.0], scope=(5, None), value="c")
+
+        assert cache.get([1.0, 0.0, 0.0], scope=(5, None)) == "a"
+        assert cache.get([0.0, 1.0, 0.0], scope=(5, None)) is None
+        assert cache.get([0.0, 0.0, 1.0], scope=(5, None)) == "c"
+
+    def test_evicted_scopes_are_forgotten(self, cache):
+        """Scope ids are dropped once no entry uses them, so distinct filters don't accumulate."""
+        for i in range(100):
+            cache.put([1.0, float(i), 0.0], scope=(5, f'{{"law": "L{i}"}}'), value=i)
+
+        assert len(cache._scope_ids) == 2
+        assert cache.get([1.0, 99.0, 0.0], scope=(5, '{"law": "L99"}')) == 99
+        assert cache.get([1.0, 0.0, 0.0], scope=(5, '{"law": "L0"}')) is None
+
+    def test_shared_scope_survives_partial_eviction(self, cache):
+        """A scope stays valid while another entry still uses it."""
+        cache.put([1.0, 0.0, 0.0], scope=(5, None), value="a")
+        cache.put([0.0, 1.0, 0.0], scope=(5, None), value="b")
+        cache.put([0.0, 0.0, 1.0], scope=(10, None), value="c")
+
+        assert cache.get([0.0, 1.0, 0.0], scope=(5, None)) == "b"
+        assert set(cache._scope_ids) == {(5, None), (10, None)}
+
+    def test_stats_and_clear(self, cache):
+        """Stats report hit rate and clear resets everything."""
+        cache.put([1.0, 0.0, 0.0], scope=(5, None), value="a")
+        cache.get([1.0, 0.0, 0.0], scope=(5, None))
+        cache.get([0.0, 1.0, 0.0], scope=(5, None))
+
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["hit_rate"] == 0.5
+
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+        assert cache.get([1.0, 0.0, 0.0], scope=(5, None)) is None
+
+
+class TestExactQueryCache:
+    """Test suite for ExactQueryCache."""
+
+    @pytest.fixture
+    def cache(self) -> ExactQueryCache:
+        """Create small cache instance for testing."""
+        return ExactQueryCache(max_entries=2, ttl_seconds=60)
+
+    def test_hit_and_miss(self, cache):
+        """Only the exact key hits."""
+        cache.put(("kündigung mietvertrag", 5, None), ["bgb-573"])
+
+        assert cache.get(("kündigung mietvertrag", 5, None)) == ["bgb-573"]
+        assert cache.get(("kündigung mietvertrag", 10, None)) is None
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_lru_eviction(self, cache):
+        """The least recently used key is evicted when full."""
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_ttl_expiry(self, cache, monkeypatch):
+        """Expired entries are dropped; no TTL means entries never expire."""
+        now = [1000.0]
+        monkeypatch.setattr(semantic_cache.time, "monotonic", lambda: now[0])
+        forever = ExactQueryCache(max_entries=2)
+
+        cache.put("a", 1)
+        forever.put("a", 1)
+        now[0] += 61
+
+        assert cache.get("a") is None
+        assert forever.get("a") == 1